@@ -22,6 +22,9 @@ setup(
     install_requires=[
         "redis>=5.0.0",
         "loguru>=0.7.0",
+        "orjson>=3.9.0",
+        "hiredis>=2.0.0",
+        "msgspec>=0.18.0",
 
     ],
     classifiers=[
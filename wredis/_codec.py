@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+
+import orjson
+
+# Payloads are prefixed with a tag so readers can dispatch on it instead of
+# attempting a JSON parse and falling back on failure. Tags start with a NUL
+# byte, which ordinary text never does, so untagged values written before
+# tagging or by other clients are never mistaken for tagged ones.
+JSON_TAG = "\x00J"
+STRING_TAG = "\x00S"
+_TAG_LENGTH = len(JSON_TAG)
+
+_JSON_PREFIX = JSON_TAG.encode()
+_DUMPS = orjson.dumps
+_NON_STR_KEYS = orjson.OPT_NON_STR_KEYS
+
+
+def dumps_json(value: object) -> bytes:
+    """
+    Serializes a value to JSON with orjson, as the standard json module would.
+
+    Non-string keys are converted to strings, and integers beyond 64 bits, which
+    orjson rejects, are handled by falling back to the json module.
+
+    Args:
+        value (object): Value to serialize.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+
+    Raises:
+        TypeError: If the value is not JSON serializable.
+    """
+    try:
+        return _DUMPS(value, option=_NON_STR_KEYS)
+    except TypeError:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def encode_payload(value: object) -> bytes | str:
+    """
+    Serializes a value with its type tag.
+
+    Args:
+        value (object): Value to serialize. Strings are stored as they are, any
+            other value as JSON, so numbers, lists and None keep their type.
+
+    Returns:
+        bytes | str: The tagged payload, ready to be sent to Redis.
+
+    Raises:
+        TypeError: If the value is bytes-like, which has no JSON representation,
+            or is otherwise not JSON serializable.
+    """
+    value_type = type(value)
+    if value_type is str:
+        return STRING_TAG + value
+    if value_type is dict:
+        return _JSON_PREFIX + dumps_json(value)
+    if isinstance(value, str):
+        return STRING_TAG + str(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        raise TypeError(
+            f"Cannot store a {value_type.__name__} payload, decode it first"
+        )
+    return _JSON_PREFIX + dumps_json(value)
+
+
+def decode_payload(raw: str) -> object:
+    """
+    Deserializes a tagged payload.
+
+    Untagged payloads, written before tagging was introduced or by other clients,
+    are parsed as JSON when possible and returned as-is otherwise.
+
+    Args:
+        raw (str): Payload returned by Redis.
+
+    Returns:
+        object: The deserialized value, a str for string payloads.
+    """
+    tag, body = raw[:_TAG_LENGTH], raw[_TAG_LENGTH:]
+    if tag == JSON_TAG:
+        return orjson.loads(body)
+    if tag == STRING_TAG:
+        return body
+
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return raw
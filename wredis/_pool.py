@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import os
+import socket
+import threading
+
+import redis
+import redis.asyncio
+from loguru import logger
+from redis._parsers import _AsyncHiredisParser, _HiredisParser
+from redis.asyncio.retry import Retry as AsyncRetry
+from redis.backoff import ExponentialBackoff
+from redis.retry import Retry
+from redis.utils import HIREDIS_AVAILABLE
+
+# redis-py already sets TCP_NODELAY on its TCP sockets, so small writes are not
+# delayed by Nagle's algorithm; keepalive lets idle pooled sockets be probed, so
+# connections dropped by NAT or firewalls are detected instead of hanging.
+_KEEPALIVE_OPTIONS = {
+    getattr(socket, name): value
+    for name, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+}
+
+# Connections idle for longer than this are checked with a PING before reuse,
+# and commands failing with a connection or timeout error are retried up to 5
+# times with exponential backoff from 0.1 s, capped at 5 s.
+_HEALTH_CHECK_INTERVAL = 30
+_RETRY_BACKOFF = {"cap": 5, "base": 0.1}
+_RETRIES = 5
+
+# Parse RESP in C when hiredis is installed (it is a declared dependency); pools
+# fall back to redis-py's pure-Python parser otherwise.
+if HIREDIS_AVAILABLE:
+    _PARSER_CLASS, _ASYNC_PARSER_CLASS = _HiredisParser, _AsyncHiredisParser
+else:
+    _PARSER_CLASS = _ASYNC_PARSER_CLASS = None
+    logger.warning("hiredis is not installed, Redis replies are parsed in Python.")
+
+# Default size of every pool; BlockingConnectionPool makes callers wait (up to
+# 20 s) for a free connection instead of opening more than this.
+DEFAULT_MAX_CONNECTIONS = int(os.getenv("WREDIS_POOL_MAX", "32"))
+
+_POOLS: dict[tuple, redis.BlockingConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _transport_options(
+    host: str, port: int, unix_socket_path: str | None, unix_connection_class: type
+) -> dict:
+    """
+    Returns the pool arguments that select the TCP or Unix socket transport.
+
+    Args:
+        host (str): Hostname of the Redis server.
+        port (int): Port number of the Redis server.
+        unix_socket_path (str | None): Path of the server's Unix socket; when set,
+            host and port are ignored.
+        unix_connection_class (type): Unix socket connection class of the client
+            flavour (sync or asyncio).
+
+    Returns:
+        dict: Keyword arguments for the connection pool.
+    """
+    if unix_socket_path:
+        # No TCP stack on the local path, so keepalive options do not apply
+        return {"connection_class": unix_connection_class, "path": unix_socket_path}
+    return {
+        "host": host,
+        "port": port,
+        "socket_keepalive": True,
+        "socket_keepalive_options": _KEEPALIVE_OPTIONS,
+    }
+
+
+def create_pool(
+    host: str = "localhost",
+    port: int = 6379,
+    db: int = 0,
+    decode_responses: bool = False,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    socket_timeout: float | None = None,
+    socket_connect_timeout: float | None = 5,
+    unix_socket_path: str | None = None,
+) -> redis.BlockingConnectionPool:
+    """
+    Creates a new, unshared connection pool with the library's socket settings.
+
+    Args:
+        host (str): Hostname of the Redis server.
+        port (int): Port number of the Redis server.
+        db (int): Redis database index.
+        decode_responses (bool): Decode replies to str at parse time.
+        max_connections (int): Maximum number of connections in the pool.
+        socket_timeout (float | None): Timeout in seconds for socket reads and writes.
+            None waits indefinitely, which blocking commands such as BRPOP or
+            XREADGROUP BLOCK rely on.
+        socket_connect_timeout (float | None): Timeout in seconds to establish a
+            connection.
+        unix_socket_path (str | None): Connect through this Unix socket instead of
+            TCP, which skips the network stack when Redis runs on the same host.
+
+    Returns:
+        redis.BlockingConnectionPool: The new connection pool.
+    """
+    return redis.BlockingConnectionPool(
+        db=db,
+        decode_responses=decode_responses,
+        max_connections=max_connections,
+        socket_timeout=socket_timeout,
+        socket_connect_timeout=socket_connect_timeout,
+        health_check_interval=_HEALTH_CHECK_INTERVAL,
+        retry=Retry(ExponentialBackoff(**_RETRY_BACKOFF), _RETRIES),
+        **({"parser_class": _PARSER_CLASS} if _PARSER_CLASS else {}),
+        **_transport_options(
+            host, port, unix_socket_path, redis.UnixDomainSocketConnection
+        ),
+    )
+
+
+def get_pool(
+    host: str = "localhost",
+    port: int = 6379,
+    db: int = 0,
+    decode_responses: bool = False,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    socket_timeout: float | None = None,
+    socket_connect_timeout: float | None = 5,
+    unix_socket_path: str | None = None,
+) -> redis.BlockingConnectionPool:
+    """
+    Returns the connection pool shared by every manager connected to the same server.
+
+    Pools are created lazily on first use and reused afterwards, so several managers
+    (and their listener threads) in one process share sockets instead of each opening
+    its own connections.
+
+    Args:
+        host (str): Hostname of the Redis server.
+        port (int): Port number of the Redis server.
+        db (int): Redis database index.
+        decode_responses (bool): Decode replies to str at parse time. Clients that
+            decode and clients that do not get separate pools.
+        max_connections (int): Maximum number of connections in a newly created pool.
+        socket_timeout (float | None): Socket read/write timeout of a newly created
+            pool, see create_pool.
+        socket_connect_timeout (float | None): Connect timeout of a newly created
+            pool, see create_pool.
+        unix_socket_path (str | None): Path of the server's Unix socket, see
+            create_pool.
+
+    Returns:
+        redis.BlockingConnectionPool: The shared connection pool.
+    """
+    key = (unix_socket_path or (host, port), db, decode_responses)
+    pool = _POOLS.get(key)
+    if pool is None:
+        with _POOLS_LOCK:
+            pool = _POOLS.get(key)
+            if pool is None:
+                pool = create_pool(
+                    host,
+                    port,
+                    db,
+                    decode_responses=decode_responses,
+                    max_connections=max_connections,
+                    socket_timeout=socket_timeout,
+                    socket_connect_timeout=socket_connect_timeout,
+                    unix_socket_path=unix_socket_path,
+                )
+                _POOLS[key] = pool
+    return pool
+
+
+def create_async_pool(
+    host: str = "localhost",
+    port: int = 6379,
+    db: int = 0,
+    decode_responses: bool = False,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    socket_timeout: float | None = None,
+    socket_connect_timeout: float | None = 5,
+    unix_socket_path: str | None = None,
+) -> redis.asyncio.BlockingConnectionPool:
+    """
+    Creates a new asyncio connection pool with the library's socket settings.
+
+    Asyncio pools are bound to the event loop that first uses them, so they are
+    never shared through get_pool.
+
+    Args:
+        host (str): Hostname of the Redis server.
+        port (int): Port number of the Redis server.
+        db (int): Redis database index.
+        decode_responses (bool): Decode replies to str at parse time.
+        max_connections (int): Maximum number of connections in the pool.
+        socket_timeout (float | None): Timeout in seconds for socket reads and writes.
+        socket_connect_timeout (float | None): Timeout in seconds to establish a
+            connection.
+        unix_socket_path (str | None): Connect through this Unix socket instead of
+            TCP, which skips the network stack when Redis runs on the same host.
+
+    Returns:
+        redis.asyncio.BlockingConnectionPool: The new connection pool.
+    """
+    return redis.asyncio.BlockingConnectionPool(
+        db=db,
+        decode_responses=decode_responses,
+        max_connections=max_connections,
+        socket_timeout=socket_timeout,
+        socket_connect_timeout=socket_connect_timeout,
+        health_check_interval=_HEALTH_CHECK_INTERVAL,
+        retry=AsyncRetry(ExponentialBackoff(**_RETRY_BACKOFF), _RETRIES),
+        **({"parser_class": _ASYNC_PARSER_CLASS} if _ASYNC_PARSER_CLASS else {}),
+        **_transport_options(
+            host, port, unix_socket_path, redis.asyncio.UnixDomainSocketConnection
+        ),
+    )
@@ -1,6 +1,17 @@
+from __future__ import annotations
+
 import redis
+from functools import cached_property
 from loguru import logger
 
+from .._pool import get_pool
+
+
+def _noop_log(*args, **kwargs) -> None:
+    """
+    Stand-in for log() when verbose mode is disabled.
+    """
+
 
 class RedisBitmapManager:
     """
@@ -8,7 +19,12 @@ class RedisBitmapManager:
     as well as managing TTL (Time-to-Live) for bitmap keys.
 
     Attributes:
-        redis_client (redis.StrictRedis): Redis client instance.
+        host (str): Hostname of the Redis server.
+        port (int): Port number of the Redis server.
+        db (int): Redis database index.
+        unix_socket_path (str | None): Path of the Redis Unix socket, used instead of
+            host and port when set.
+        redis_client (redis.StrictRedis): Redis client instance, created on first use.
         verbose (bool): Enables detailed logging if True.
     """
 
@@ -18,6 +34,7 @@ class RedisBitmapManager:
         port: int = 6379,
         db: int = 0,
         verbose: bool = True,
+        unix_socket_path: str | None = None,
     ):
         """
         Initializes the RedisBitmapManager with connection details.
@@ -27,25 +44,48 @@ class RedisBitmapManager:
             port (int): Port number of the Redis server.
             db (int): Redis database index.
             verbose (bool): Enable detailed logging if True.
+            unix_socket_path (str | None): Path of the Redis Unix socket. When set, it
+                is used instead of host and port, avoiding the TCP stack for a local
+                server.
         """
-        self.redis_client = redis.StrictRedis(host=host, port=port, db=db)
+        self.host = host
+        self.port = port
+        self.db = db
+        self.unix_socket_path = unix_socket_path
         self.verbose = verbose
+        self.log = self._log_verbose if verbose else _noop_log
 
-    def log(self, message: str, level: str = "info") -> None:
+    @cached_property
+    def redis_client(self) -> redis.StrictRedis:
         """
-        Logs a message if verbose mode is enabled.
+        Redis client, created on first use on top of the shared connection pool.
+        """
+        return redis.StrictRedis(
+            connection_pool=get_pool(
+                self.host,
+                self.port,
+                self.db,
+                unix_socket_path=self.unix_socket_path,
+            )
+        )
+
+    def _log_verbose(self, message: str, *args, level: str = "info") -> None:
+        """
+        Logs a message. Bound as log() when verbose mode is enabled.
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log, with "{}" placeholders for args.
+            args: Values formatted into the message only when it is emitted.
             level (str): The log level (e.g., "info", "warning", "error").
         """
-        if self.verbose:
-            getattr(logger, level)(message)
+        getattr(logger, level)(message, *args)
 
     def set_bit(self, key: str, offset: int, value: int, ttl: int = -1) -> None:
         """
         Sets a bit at a specific position in a bitmap and optionally sets a TTL.
 
+        The SETBIT and the optional EXPIRE are sent together in one round trip.
+
         Args:
             key (str): The Redis key for the bitmap.
             offset (int): The position of the bit to set.
@@ -53,13 +93,16 @@ class RedisBitmapManager:
             ttl (int): The time-to-live for the key in seconds. If -1, no TTL is set.
         """
         try:
-            self.redis_client.setbit(key, offset, value)
-            self.log(f"Set bit in '{key}' at position {offset} to value {value}.")
+            with self.redis_client.pipeline(transaction=False) as p:
+                p.setbit(key, offset, value)
+                if ttl > 0:
+                    p.expire(key, ttl)
+                p.execute()
+            self.log("Set bit in '{}' at position {} to value {}.", key, offset, value)
 
             if ttl > 0:
-                self.redis_client.expire(key, ttl)
-                self.log(f"Set TTL of {ttl} seconds for '{key}'.")
-        except Exception as e:
+                self.log("Set TTL of {} seconds for '{}'.", ttl, key)
+        except redis.RedisError as e:
             logger.error(f"Error setting bit in '{key}': {e}")
 
     def get_bit(self, key: str, offset: int) -> int:
@@ -75,12 +118,64 @@ class RedisBitmapManager:
         """
         try:
             bit_value = self.redis_client.getbit(key, offset)
-            self.log(f"Bit value in '{key}' at position {offset}: {bit_value}.")
+            self.log("Bit value in '{}' at position {}: {}.", key, offset, bit_value)
             return bit_value
-        except Exception as e:
+        except redis.RedisError as e:
             logger.error(f"Error retrieving bit from '{key}': {e}")
             return 0
 
+    def set_bits(self, key: str, pairs: list[tuple[int, int]], ttl: int = -1) -> None:
+        """
+        Sets many bits of a bitmap with a single BITFIELD command and optionally sets a TTL.
+
+        Args:
+            key (str): The Redis key for the bitmap.
+            pairs (list[tuple[int, int]]): Tuples of (offset, value) with value 0 or 1.
+            ttl (int): The time-to-live for the key in seconds. If -1, no TTL is set.
+        """
+        try:
+            args = []
+            for offset, value in pairs:
+                args += ["SET", "u1", offset, value]
+
+            with self.redis_client.pipeline(transaction=False) as p:
+                p.execute_command("BITFIELD", key, *args)
+                if ttl > 0:
+                    p.expire(key, ttl)
+                p.execute()
+
+            self.log("Set {} bits in '{}'.", len(pairs), key)
+            if ttl > 0:
+                self.log("Set TTL of {} seconds for '{}'.", ttl, key)
+        except redis.RedisError as e:
+            logger.error(f"Error setting bits in '{key}': {e}")
+
+    def get_bits(self, key: str, offsets: list[int]) -> list[int]:
+        """
+        Retrieves many bits of a bitmap with a single BITFIELD command.
+
+        Args:
+            key (str): The Redis key for the bitmap.
+            offsets (list[int]): The positions of the bits to retrieve.
+
+        Returns:
+            list[int]: The value of each bit (0 or 1), in the same order as offsets.
+        """
+        try:
+            if not offsets:
+                return []
+
+            args = []
+            for offset in offsets:
+                args += ["GET", "u1", offset]
+
+            bit_values = self.redis_client.execute_command("BITFIELD", key, *args)
+            self.log("Retrieved {} bits from '{}'.", len(bit_values), key)
+            return bit_values
+        except redis.RedisError as e:
+            logger.error(f"Error retrieving bits from '{key}': {e}")
+            return [0] * len(offsets)
+
     def count_bits(self, key: str) -> int:
         """
         Counts the number of bits set to 1 in a bitmap.
@@ -93,9 +188,60 @@ class RedisBitmapManager:
         """
         try:
             bit_count = self.redis_client.bitcount(key)
-            self.log(f"Number of bits set to 1 in '{key}': {bit_count}.")
+            self.log("Number of bits set to 1 in '{}': {}.", key, bit_count)
+            return bit_count
+        except redis.RedisError as e:
+            logger.error(f"Error counting bits in '{key}': {e}")
+            return 0
+
+    def count_bits_range(self, key: str, start_byte: int, end_byte: int) -> int:
+        """
+        Counts the number of bits set to 1 within a byte range of a bitmap.
+
+        Args:
+            key (str): The Redis key for the bitmap.
+            start_byte (int): First byte of the range (inclusive).
+            end_byte (int): Last byte of the range (inclusive).
+
+        Returns:
+            int: The number of bits set to 1 in the range.
+        """
+        try:
+            bit_count = self.redis_client.bitcount(key, start_byte, end_byte)
+            self.log(
+                "Number of bits set to 1 in '{}' between bytes {} and {}: {}.",
+                key,
+                start_byte,
+                end_byte,
+                bit_count,
+            )
+            return bit_count
+        except redis.RedisError as e:
+            logger.error(f"Error counting bits in '{key}': {e}")
+            return 0
+
+    def count_bits_sharded(self, key: str, total_bytes: int, shards: int) -> int:
+        """
+        Counts the bits set to 1 in the first total_bytes of a bitmap by splitting it
+        into byte ranges and sending one BITCOUNT per range in a single pipeline.
+
+        Args:
+            key (str): The Redis key for the bitmap.
+            total_bytes (int): Number of bytes of the bitmap to count.
+            shards (int): Number of byte ranges to split the bitmap into.
+
+        Returns:
+            int: The number of bits set to 1.
+        """
+        try:
+            shard_size = max(-(-total_bytes // max(shards, 1)), 1)
+            with self.redis_client.pipeline(transaction=False) as p:
+                for start in range(0, total_bytes, shard_size):
+                    p.bitcount(key, start, min(start + shard_size, total_bytes) - 1)
+                bit_count = sum(p.execute())
+            self.log("Number of bits set to 1 in '{}': {}.", key, bit_count)
             return bit_count
-        except Exception as e:
+        except redis.RedisError as e:
             logger.error(f"Error counting bits in '{key}': {e}")
             return 0
 
@@ -112,13 +258,13 @@ class RedisBitmapManager:
         try:
             ttl = self.redis_client.ttl(key)
             if ttl == -1:
-                self.log(f"The bitmap '{key}' has no TTL set.", level="warning")
+                self.log("The bitmap '{}' has no TTL set.", key, level="warning")
             elif ttl == -2:
-                self.log(f"The bitmap '{key}' does not exist.", level="warning")
+                self.log("The bitmap '{}' does not exist.", key, level="warning")
             else:
-                self.log(f"The TTL for bitmap '{key}' is {ttl} seconds.")
+                self.log("The TTL for bitmap '{}' is {} seconds.", key, ttl)
             return ttl
-        except Exception as e:
+        except redis.RedisError as e:
             logger.error(f"Error retrieving TTL for '{key}': {e}")
             return -2
 
@@ -131,13 +277,13 @@ class RedisBitmapManager:
             ttl (int): The new TTL in seconds.
         """
         try:
-            if self.redis_client.exists(key):
-                self.redis_client.expire(key, ttl)
-                self.log(f"Extended TTL for bitmap '{key}' to {ttl} seconds.")
+            if self.redis_client.expire(key, ttl):
+                self.log("Extended TTL for bitmap '{}' to {} seconds.", key, ttl)
             else:
                 self.log(
-                    f"Cannot set TTL because the bitmap '{key}' does not exist.",
+                    "Cannot set TTL because the bitmap '{}' does not exist.",
+                    key,
                     level="warning",
                 )
-        except Exception as e:
+        except redis.RedisError as e:
             logger.error(f"Error extending TTL for '{key}': {e}")
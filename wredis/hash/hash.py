@@ -1,7 +1,29 @@
-import json
+from __future__ import annotations
+
 import redis
+from functools import cached_property
 from loguru import logger
 
+from .._codec import decode_payload, encode_payload
+from .._pool import get_pool
+
+# Sets field ARGV[1] of the hash to ARGV[3] only if it still holds ARGV[2], an
+# empty ARGV[2] standing for a missing field. Returns 1 if the field was set.
+_HSET_IF_UNCHANGED_SCRIPT = """
+local current = redis.call('HGET', KEYS[1], ARGV[1])
+if (current or '') ~= ARGV[2] then
+    return 0
+end
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[3])
+return 1
+"""
+
+
+def _noop_log(*args, **kwargs) -> None:
+    """
+    Stand-in for log() when verbose mode is disabled.
+    """
+
 
 class RedisHashManager:
     """
@@ -9,7 +31,12 @@ class RedisHashManager:
     deleting fields, and managing TTL (Time-to-Live).
 
     Attributes:
-        redis_client (redis.StrictRedis): Redis client instance.
+        host (str): Hostname of the Redis server.
+        port (int): Port number of the Redis server.
+        db (int): Redis database index.
+        unix_socket_path (str | None): Path of the Redis Unix socket, used instead of
+            host and port when set.
+        redis_client (redis.StrictRedis): Redis client instance, created on first use.
         verbose (bool): Enables detailed logging if True.
     """
 
@@ -19,6 +46,7 @@ class RedisHashManager:
         port: int = 6379,
         db: int = 0,
         verbose: bool = True,
+        unix_socket_path: str | None = None,
     ):
         """
         Initializes the RedisHashManager with connection details.
@@ -28,42 +56,145 @@ class RedisHashManager:
             port (int): Port number of the Redis server.
             db (int): Redis database index.
             verbose (bool): Enable detailed logging if True.
+            unix_socket_path (str | None): Path of the Redis Unix socket. When set, it
+                is used instead of host and port, avoiding the TCP stack for a local
+                server.
         """
-        self.redis_client = redis.StrictRedis(host=host, port=port, db=db)
+        self.host = host
+        self.port = port
+        self.db = db
+        self.unix_socket_path = unix_socket_path
         self.verbose = verbose
+        self.log = self._log_verbose if verbose else _noop_log
 
-    def log(self, message: str, level: str = "info") -> None:
+    @cached_property
+    def redis_client(self) -> redis.StrictRedis:
+        """
+        Redis client, created on first use on top of the shared connection pool.
         """
-        Logs a message if verbose mode is enabled.
+        return redis.StrictRedis(
+            connection_pool=get_pool(
+                self.host,
+                self.port,
+                self.db,
+                decode_responses=True,
+                unix_socket_path=self.unix_socket_path,
+            )
+        )
+
+    @cached_property
+    def _hset_if_unchanged_script(self) -> redis.commands.core.Script:
+        """
+        Cached Lua script used by update_hash, registered on first use.
+        """
+        return self.redis_client.register_script(_HSET_IF_UNCHANGED_SCRIPT)
+
+    def _log_verbose(self, message: str, *args, level: str = "info") -> None:
+        """
+        Logs a message. Bound as log() when verbose mode is enabled.
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log, with "{}" placeholders for args.
+            args: Values formatted into the message only when it is emitted.
             level (str): The log level (e.g., "info", "warning", "error").
         """
-        if self.verbose:
-            getattr(logger, level)(message)
+        getattr(logger, level)(message, *args)
 
     def create_hash(
-        self, hash_name: str, key: str, value: dict | str, ttl: int = -1
+        self,
+        hash_name: str,
+        key: str,
+        value: object,
+        ttl: int = -1,
+        pipe: redis.client.Pipeline | None = None,
     ) -> None:
         """
         Writes a key-value pair into a Redis hash and optionally sets a TTL.
 
+        The HSET and the optional EXPIRE are sent together in a single pipeline,
+        so the TTL path costs one round trip instead of two.
+
+        Args:
+            hash_name (str): Name of the hash in Redis.
+            key (str): Key within the hash.
+            value (object): Value to store; anything but a string is serialized to JSON.
+            ttl (int): Time-to-live for the hash in seconds. If -1, no TTL is set.
+            pipe (redis.client.Pipeline | None): External pipeline to queue the commands on.
+                If given, the caller is responsible for executing it.
+        """
+        try:
+            json_value = encode_payload(value)
+
+            if pipe is None:
+                with self.redis_client.pipeline(transaction=False) as p:
+                    self._queue_hash_write(p, hash_name, key, json_value, ttl)
+                    p.execute()
+            else:
+                self._queue_hash_write(pipe, hash_name, key, json_value, ttl)
+
+            self.log("Written to hash '{}' -> {}: {}", hash_name, key, value)
+            if ttl > 0:
+                self.log("Set TTL of {} seconds for hash '{}'", ttl, hash_name)
+        except redis.RedisError as e:
+            logger.error(f"Error writing to hash '{hash_name}': {e}")
+
+    def create_hashes_bulk(self, items: list[tuple], ttl: int = -1) -> None:
+        """
+        Writes many key-value pairs into Redis hashes using a single pipeline.
+
         Args:
+            items (list[tuple]): Tuples of (hash_name, key, value), as accepted by create_hash.
+            ttl (int): Time-to-live for each written hash in seconds. If -1, no TTL is set.
+        """
+        try:
+            with self.redis_client.pipeline(transaction=False) as p:
+                for hash_name, key, value in items:
+                    self.create_hash(hash_name, key, value, ttl=ttl, pipe=p)
+                p.execute()
+            self.log("Written {} fields in bulk", len(items))
+        except redis.RedisError as e:
+            logger.error(f"Error writing hashes in bulk: {e}")
+
+    @staticmethod
+    def _queue_hash_write(
+        pipe: redis.client.Pipeline, hash_name: str, key: str, value, ttl: int
+    ) -> None:
+        """
+        Queues the HSET and optional EXPIRE of a hash write on a pipeline.
+
+        Args:
+            pipe (redis.client.Pipeline): Pipeline to queue the commands on.
             hash_name (str): Name of the hash in Redis.
             key (str): Key within the hash.
-            value (dict | str): Value to store, serialized to JSON if it is a dictionary.
+            value: Already serialized value to store.
+            ttl (int): Time-to-live for the hash in seconds. If -1, no TTL is set.
+        """
+        pipe.hset(hash_name, key, value)
+        if ttl > 0:
+            pipe.expire(hash_name, ttl)
+
+    def create_hash_many(self, hash_name: str, mapping: dict, ttl: int = -1) -> None:
+        """
+        Writes several key-value pairs into a single Redis hash with one HSET.
+
+        Args:
+            hash_name (str): Name of the hash in Redis.
+            mapping (dict): Keys within the hash and their values. Values other
+                than strings are serialized to JSON.
             ttl (int): Time-to-live for the hash in seconds. If -1, no TTL is set.
         """
         try:
-            json_value = json.dumps(value) if isinstance(value, dict) else value
-            self.redis_client.hset(hash_name, key, json_value)
-            self.log(f"Written to hash '{hash_name}' -> {key}: {value}")
+            encoded = {key: encode_payload(value) for key, value in mapping.items()}
+            with self.redis_client.pipeline(transaction=False) as p:
+                p.hset(hash_name, mapping=encoded)
+                if ttl > 0:
+                    p.expire(hash_name, ttl)
+                p.execute()
 
+            self.log("Written {} fields to hash '{}'", len(encoded), hash_name)
             if ttl > 0:
-                self.redis_client.expire(hash_name, ttl)
-                self.log(f"Set TTL of {ttl} seconds for hash '{hash_name}'")
-        except Exception as e:
+                self.log("Set TTL of {} seconds for hash '{}'", ttl, hash_name)
+        except redis.RedisError as e:
             logger.error(f"Error writing to hash '{hash_name}': {e}")
 
     def read_hash(self, hash_name: str, key: str) -> dict | str | None:
@@ -80,43 +211,77 @@ class RedisHashManager:
         try:
             json_value = self.redis_client.hget(hash_name, key)
             if json_value:
-                json_value = json_value.decode()
-                try:
-                    return json.loads(json_value)
-                except json.JSONDecodeError:
-                    return json_value
+                return decode_payload(json_value)
             else:
                 self.log(
-                    f"Field '{key}' does not exist in hash '{hash_name}'.",
+                    "Field '{}' does not exist in hash '{}'.",
+                    key,
+                    hash_name,
                     level="warning",
                 )
                 return None
-        except Exception as e:
+        except redis.RedisError as e:
             logger.error(f"Error reading from hash '{hash_name}': {e}")
             return None
 
+    def read_hashes(self, hash_name: str, keys: list[str]) -> list[dict | str | None]:
+        """
+        Reads several key-value pairs from a Redis hash with one HMGET.
+
+        Args:
+            hash_name (str): Name of the hash in Redis.
+            keys (list[str]): Keys within the hash.
+
+        Returns:
+            list[dict | str | None]: The values in the same order as keys, None for missing fields.
+        """
+        try:
+            values = self.redis_client.hmget(hash_name, keys)
+            return [decode_payload(v) if v else None for v in values]
+        except redis.RedisError as e:
+            logger.error(f"Error reading from hash '{hash_name}': {e}")
+            return [None] * len(keys)
+
     def update_hash(self, hash_name: str, key: str, new_data: dict) -> None:
         """
         Updates a key-value pair in a Redis hash. If the field does not exist, it adds it.
 
+        The field is read, merged in Python and written back by a script that only
+        sets it if it still holds the value read, so concurrent updates are not
+        lost; on a conflict the update is retried. That is two round trips, and
+        numbers and empty lists are stored exactly as given.
+
         Args:
             hash_name (str): Name of the hash in Redis.
             key (str): Key within the hash.
             new_data (dict): New data to update the field.
         """
         try:
-            current_value = self.read_hash(hash_name, key)
+            while True:
+                raw = self.redis_client.hget(hash_name, key)
+                current = decode_payload(raw) if raw else None
+                merged = isinstance(current, dict)
+                if merged:
+                    current.update(new_data)
+                if self._hset_if_unchanged_script(
+                    keys=[hash_name],
+                    args=[
+                        key,
+                        raw or "",
+                        encode_payload(current if merged else new_data),
+                    ],
+                ):
+                    break
 
-            if isinstance(current_value, dict):
-                current_value.update(new_data)
-                self.create_hash(hash_name, key, current_value)
+            if merged:
                 self.log(
-                    f"Updated field '{key}' in hash '{hash_name}': {current_value}"
+                    "Updated field '{}' in hash '{}': {}", key, hash_name, new_data
                 )
             else:
-                self.create_hash(hash_name, key, new_data)
-                self.log(f"Added new field '{key}' to hash '{hash_name}': {new_data}")
-        except Exception as e:
+                self.log(
+                    "Added new field '{}' to hash '{}': {}", key, hash_name, new_data
+                )
+        except redis.RedisError as e:
             logger.error(f"Error updating field '{key}' in hash '{hash_name}': {e}")
 
     def delete_hash_field(self, hash_name: str, key: str) -> None:
@@ -130,13 +295,15 @@ class RedisHashManager:
         try:
             result = self.redis_client.hdel(hash_name, key)
             if result:
-                self.log(f"Deleted field '{key}' from hash '{hash_name}'.")
+                self.log("Deleted field '{}' from hash '{}'.", key, hash_name)
             else:
                 self.log(
-                    f"Field '{key}' does not exist in hash '{hash_name}'.",
+                    "Field '{}' does not exist in hash '{}'.",
+                    key,
+                    hash_name,
                     level="warning",
                 )
-        except Exception as e:
+        except redis.RedisError as e:
             logger.error(f"Error deleting field '{key}' from hash '{hash_name}': {e}")
 
     def read_all_hash(self, hash_name: str) -> dict | None:
@@ -154,24 +321,70 @@ class RedisHashManager:
             if hash_data:
                 items = {}
                 for key, value in hash_data.items():
-                    value = value.decode()
-                    try:
-                        value = json.loads(value)
-                    except json.JSONDecodeError:
-                        pass
-                    items[key.decode()] = value
-
-                self.log(f"Read all fields from hash '{hash_name}': {items}")
+                    items[key] = decode_payload(value)
+
+                self.log("Read {} fields from hash '{}'", len(items), hash_name)
                 return items
             else:
                 self.log(
-                    f"Hash '{hash_name}' is empty or does not exist.", level="warning"
+                    "Hash '{}' is empty or does not exist.", hash_name, level="warning"
                 )
                 return None
-        except Exception as e:
+        except redis.RedisError as e:
             logger.error(f"Error reading all fields from hash '{hash_name}': {e}")
             return None
 
+    def read_all_hash_stream(self, hash_name: str, count: int = 500):
+        """
+        Iterates over all fields and values of a Redis hash using HSCAN, so large
+        hashes are fetched in batches instead of a single HGETALL reply.
+
+        Args:
+            hash_name (str): Name of the hash in Redis.
+            count (int): Number of fields Redis is asked to return per batch.
+
+        Yields:
+            tuple[str, dict | str]: Each field and its deserialized value.
+        """
+        try:
+            for key, value in self.redis_client.hscan_iter(hash_name, count=count):
+                yield key, decode_payload(value)
+        except redis.RedisError as e:
+            logger.error(f"Error scanning hash '{hash_name}': {e}")
+
+    def read_all_hash_columnar(
+        self, hash_name: str, columns: list[str]
+    ) -> tuple[list[str], dict[str, list]]:
+        """
+        Reads all fields of a hash whose values are JSON records and returns them
+        column by column instead of as one dictionary per field.
+
+        Args:
+            hash_name (str): Name of the hash in Redis.
+            columns (list[str]): Record attributes to extract.
+
+        Returns:
+            tuple[list[str], dict[str, list]]: The field names, and for each column the
+                list of values in the same order. Missing attributes, and values that
+                are not JSON records, yield None.
+        """
+        keys = []
+        out = {column: [] for column in columns}
+        try:
+            for key, value in self.redis_client.hgetall(hash_name).items():
+                record = decode_payload(value)
+                if not isinstance(record, dict):
+                    record = {}
+                keys.append(key)
+                for column in columns:
+                    out[column].append(record.get(column))
+
+            self.log("Read {} records from hash '{}'", len(keys), hash_name)
+            return keys, out
+        except redis.RedisError as e:
+            logger.error(f"Error reading all fields from hash '{hash_name}': {e}")
+            return [], {column: [] for column in columns}
+
     def get_ttl(self, hash_name: str) -> int | None:
         """
         Retrieves the remaining time-to-live (TTL) for a Redis hash.
@@ -185,13 +398,13 @@ class RedisHashManager:
         try:
             ttl = self.redis_client.ttl(hash_name)
             if ttl == -1:
-                self.log(f"Hash '{hash_name}' has no TTL set.", level="warning")
+                self.log("Hash '{}' has no TTL set.", hash_name, level="warning")
             elif ttl == -2:
-                self.log(f"Hash '{hash_name}' does not exist.", level="warning")
+                self.log("Hash '{}' does not exist.", hash_name, level="warning")
             else:
-                self.log(f"TTL for hash '{hash_name}' is {ttl} seconds.")
+                self.log("TTL for hash '{}' is {} seconds.", hash_name, ttl)
             return ttl
-        except Exception as e:
+        except redis.RedisError as e:
             logger.error(f"Error retrieving TTL for hash '{hash_name}': {e}")
             return None
 
@@ -204,13 +417,13 @@ class RedisHashManager:
             ttl (int): New TTL in seconds.
         """
         try:
-            if self.redis_client.exists(hash_name):
-                self.redis_client.expire(hash_name, ttl)
-                self.log(f"Extended TTL for hash '{hash_name}' to {ttl} seconds.")
+            if self.redis_client.expire(hash_name, ttl):
+                self.log("Extended TTL for hash '{}' to {} seconds.", hash_name, ttl)
             else:
                 self.log(
-                    f"Cannot set TTL because hash '{hash_name}' does not exist.",
+                    "Cannot set TTL because hash '{}' does not exist.",
+                    hash_name,
                     level="warning",
                 )
-        except Exception as e:
+        except redis.RedisError as e:
             logger.error(f"Error extending TTL for hash '{hash_name}': {e}")
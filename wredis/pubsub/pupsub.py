@@ -1,19 +1,38 @@
+from __future__ import annotations
+
 import redis
-from threading import Thread
+from functools import cached_property, partial
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Event, Lock, Thread, Timer
 import signal
-import json
 from loguru import logger
 
+from .._codec import decode_payload, encode_payload
+from .._pool import get_pool
+
+
+def _noop_log(*args, **kwargs) -> None:
+    """
+    Stand-in for log() when verbose mode is disabled.
+    """
+
 
 class RedisPubSubManager:
     """
     Manages Redis Pub/Sub functionality, including publishing messages and subscribing to channels.
 
     Attributes:
-        redis_client (redis.StrictRedis): Redis client instance.
-        pubsub (redis.client.PubSub): Redis Pub/Sub instance.
+        host (str): Hostname of the Redis server.
+        port (int): Port number of the Redis server.
+        db (int): Redis database index.
+        unix_socket_path (str | None): Path of the Redis Unix socket, used instead of
+            host and port when set.
+        redis_client (redis.StrictRedis): Redis client instance, created on first use.
+        pubsub (redis.client.PubSub): Redis Pub/Sub instance shared by all subscriptions.
         subscribers (dict): Dictionary of channels and their associated callbacks.
-        threads (list): List of threads listening to channels.
+        max_workers (int): Number of worker threads that run the callbacks.
+        publish_batch_size (int): Number of buffered publishes that triggers a flush.
+        publish_flush_interval (float): Seconds after which buffered publishes are flushed.
         verbose (bool): Enables detailed logging if True.
     """
 
@@ -23,6 +42,10 @@ class RedisPubSubManager:
         port: int = 6379,
         db: int = 0,
         verbose: bool = True,
+        max_workers: int = 8,
+        publish_batch_size: int = 1,
+        publish_flush_interval: float = 0.005,
+        unix_socket_path: str | None = None,
     ):
         """
         Initializes the RedisPubSubManager with connection details.
@@ -32,23 +55,66 @@ class RedisPubSubManager:
             port (int): Port number of the Redis server.
             db (int): Redis database index.
             verbose (bool): Enable detailed logging if True.
+            max_workers (int): Number of worker threads that run the callbacks.
+            publish_batch_size (int): If greater than 1, publish_message buffers messages
+                in a pipeline and sends them once this many are queued. Call flush()
+                before exiting so buffered messages are not lost.
+            publish_flush_interval (float): Seconds after the first buffered message at
+                which the buffer is flushed even if it is not full.
+            unix_socket_path (str | None): Path of the Redis Unix socket. When set, it
+                is used instead of host and port, avoiding the TCP stack for a local
+                server.
         """
-        self.redis_client = redis.StrictRedis(host=host, port=port, db=db)
-        self.pubsub = self.redis_client.pubsub()
+        self.host = host
+        self.port = port
+        self.db = db
+        self.unix_socket_path = unix_socket_path
         self.subscribers = {}
-        self.threads = []
+        self.max_workers = max_workers
+        self._listener_thread = None
+        self._executor = None
+        self._stop = Event()
+        self.publish_batch_size = publish_batch_size
+        self.publish_flush_interval = publish_flush_interval
+        self._pub_pipe = None
+        self._pub_count = 0
+        self._pub_timer = None
+        self._pub_lock = Lock()
         self.verbose = verbose
+        self.log = self._log_verbose if verbose else _noop_log
 
-    def log(self, message: str, level: str = "info") -> None:
+    @cached_property
+    def redis_client(self) -> redis.StrictRedis:
+        """
+        Redis client, created on first use on top of the shared connection pool.
         """
-        Logs a message if verbose mode is enabled.
+        return redis.StrictRedis(
+            connection_pool=get_pool(
+                self.host,
+                self.port,
+                self.db,
+                decode_responses=True,
+                unix_socket_path=self.unix_socket_path,
+            )
+        )
+
+    @cached_property
+    def pubsub(self) -> redis.client.PubSub:
+        """
+        Pub/Sub object shared by all subscriptions, created on first use.
+        """
+        return self.redis_client.pubsub()
+
+    def _log_verbose(self, message: str, *args, level: str = "info") -> None:
+        """
+        Logs a message. Bound as log() when verbose mode is enabled.
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log, with "{}" placeholders for args.
+            args: Values formatted into the message only when it is emitted.
             level (str): The log level (e.g., "info", "warning", "error").
         """
-        if self.verbose:
-            getattr(logger, level)(message)
+        getattr(logger, level)(message, *args)
 
     def publish_message(self, channel: str, message: str | dict) -> None:
         """
@@ -62,16 +128,71 @@ class RedisPubSubManager:
             ValueError: If the message is neither a string nor a dictionary.
         """
         try:
-            if isinstance(message, dict):
-                message = json.dumps(message)
-            elif not isinstance(message, str):
+            message_type = type(message)
+            if (
+                message_type is not dict
+                and message_type is not str
+                and not isinstance(message, (dict, str))
+            ):
                 raise ValueError("Message must be a string or a JSON dictionary.")
+            payload = encode_payload(message)
 
-            self.redis_client.publish(channel, message)
-            self.log(f"Message published to channel '{channel}': {message}")
-        except Exception as e:
+            if self.publish_batch_size > 1:
+                self._buffer_publish(channel, payload)
+                self.log("Message queued for channel '{}': {}", channel, message)
+            else:
+                self.redis_client.publish(channel, payload)
+                self.log("Message published to channel '{}': {}", channel, message)
+        except redis.RedisError as e:
             logger.error(f"Error publishing message to channel '{channel}': {e}")
 
+    def _buffer_publish(self, channel: str, payload: bytes | str) -> None:
+        """
+        Queues a PUBLISH on the shared publish pipeline, flushing it when it is full
+        and otherwise arming the inactivity timer.
+
+        Args:
+            channel (str): The channel to publish the message to.
+            payload (bytes | str): The encoded message.
+        """
+        with self._pub_lock:
+            if self._pub_pipe is None:
+                self._pub_pipe = self.redis_client.pipeline(transaction=False)
+            self._pub_pipe.publish(channel, payload)
+            self._pub_count += 1
+
+            if self._pub_count >= self.publish_batch_size:
+                self._flush_publishes()
+            elif self._pub_timer is None:
+                self._pub_timer = Timer(self.publish_flush_interval, self.flush)
+                self._pub_timer.daemon = True
+                self._pub_timer.start()
+
+    def _flush_publishes(self) -> None:
+        """
+        Sends every buffered PUBLISH in one round trip. Must be called with the
+        publish lock held.
+        """
+        if self._pub_timer is not None:
+            self._pub_timer.cancel()
+            self._pub_timer = None
+
+        if self._pub_count:
+            count = self._pub_count
+            self._pub_count = 0
+            self._pub_pipe.execute()
+            self.log("Flushed {} buffered messages", count)
+
+    def flush(self) -> None:
+        """
+        Sends all messages buffered by publish_message.
+        """
+        try:
+            with self._pub_lock:
+                self._flush_publishes()
+        except redis.RedisError as e:
+            logger.error(f"Error flushing buffered messages: {e}")
+
     def on_message(self, channel: str):
         """
         Decorator to register a callback function for a specific Redis channel.
@@ -86,55 +207,126 @@ class RedisPubSubManager:
         def decorator(callback):
             if channel not in self.subscribers:
                 self.subscribers[channel] = callback
-                self._start_listener(channel)
+                if self._is_pattern(channel):
+                    self.pubsub.psubscribe(channel)
+                else:
+                    self.pubsub.subscribe(channel)
+                self._start_listener()
                 self.log(
-                    f"Subscribed to channel '{channel}' with handler '{callback.__name__}'"
+                    "Subscribed to channel '{}' with handler '{}'",
+                    channel,
+                    callback.__name__,
                 )
             else:
                 self.log(
-                    f"Handler already registered for channel '{channel}'",
+                    "Handler already registered for channel '{}'",
+                    channel,
                     level="warning",
                 )
             return callback
 
         return decorator
 
-    def _start_listener(self, channel: str) -> None:
+    @staticmethod
+    def _is_pattern(channel: str) -> bool:
+        """
+        Checks whether a channel name is a glob-style pattern (e.g. "news.*").
+
+        Args:
+            channel (str): The channel name.
+
+        Returns:
+            bool: True if the channel must be subscribed with PSUBSCRIBE.
+        """
+        return any(char in channel for char in "*?[")
+
+    @staticmethod
+    def _handle(callback, data: str) -> None:
+        """
+        Decodes a payload and runs its callback. Executed on the worker threads.
+
+        Args:
+            callback (Callable): The callback registered for the channel.
+            data (str): Raw payload received from Redis.
+        """
+        callback(decode_payload(data))
+
+    @staticmethod
+    def _on_done(channel: str, future: Future) -> None:
         """
-        Starts a thread to listen for messages on a specific channel and execute the associated callback.
+        Logs the error of a callback run on the worker threads, if it raised.
 
         Args:
-            channel (str): The channel to listen to.
+            channel (str): Channel the message was received on.
+            future (Future): Future of the finished _handle call.
+        """
+        if future.exception() is not None:
+            logger.error(
+                f"Error processing message from channel '{channel}': "
+                f"{future.exception()}"
+            )
+
+    def _start_listener(self) -> None:
+        """
+        Starts the single thread that listens on the shared Pub/Sub connection.
+
+        The listener only receives messages: each wake-up drains everything already
+        buffered on the connection, and decoding plus callbacks run on a thread pool so
+        a slow handler does not delay the following messages. The thread is only started
+        once; later subscriptions reuse it.
         """
+        if self._listener_thread is not None and self._listener_thread.is_alive():
+            return
+
+        self._stop.clear()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
 
         def listener():
-            local_pubsub = self.redis_client.pubsub()
-            local_pubsub.subscribe(channel)
-            self.log(f"Listening for messages on channel '{channel}'")
-
-            for message in local_pubsub.listen():
-                if message["type"] == "message" and channel in self.subscribers:
-                    callback = self.subscribers[channel]
-                    data = message["data"].decode()
-                    try:
-                        data = json.loads(data)
-                    except json.JSONDecodeError:
-                        pass
-                    callback(data)
-
-        thread = Thread(target=listener)
-        thread.daemon = True
-        thread.start()
-        self.threads.append(thread)
+            self.log("Listening for messages on the shared Pub/Sub connection")
+            get_message = self.pubsub.get_message
+
+            while not self._stop.is_set():
+                message = get_message(ignore_subscribe_messages=True, timeout=0.1)
+                if message is None:
+                    continue
+
+                batch = [message]
+                while (
+                    message := get_message(ignore_subscribe_messages=True, timeout=0)
+                ) is not None:
+                    batch.append(message)
+
+                for message in batch:
+                    if message["type"] == "pmessage":
+                        callback = self.subscribers.get(message["pattern"])
+                    else:
+                        callback = self.subscribers.get(message["channel"])
+                    if callback is not None:
+                        future = self._executor.submit(
+                            self._handle, callback, message["data"]
+                        )
+                        future.add_done_callback(
+                            partial(self._on_done, message["channel"])
+                        )
+
+        self._listener_thread = Thread(target=listener)
+        self._listener_thread.daemon = True
+        self._listener_thread.start()
 
     def stop_listeners(self) -> None:
         """
-        Stops all listener threads.
+        Stops the listener thread, waits for running callbacks and drops every subscription.
         """
-        for thread in self.threads:
-            if thread.is_alive():
-                self.log("Stopping listener thread...")
-        self.threads.clear()
+        if self._listener_thread is not None:
+            self.log("Stopping listener thread...")
+            self._stop.set()
+            self._listener_thread.join()
+            self._executor.shutdown(wait=True)
+            self.pubsub.unsubscribe()
+            self.pubsub.punsubscribe()
+        self.subscribers.clear()
+        self._listener_thread = None
+        self._executor = None
 
 
 # Example usage
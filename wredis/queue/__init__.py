@@ -1 +1 @@
-from .queue import RedisQueueManager
\ No newline at end of file
+from .queue import AutoPipeliner, RedisQueueManager
\ No newline at end of file
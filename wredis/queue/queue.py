@@ -1,9 +1,159 @@
+from __future__ import annotations
+
+import asyncio
 import redis
-import json
+import redis.asyncio
+from functools import cached_property
+import msgspec
+import orjson
 import threading
+from concurrent.futures import Future
+from queue import Full, Queue
 import signal
 from loguru import logger
 
+from .._codec import dumps_json
+from .._pool import (
+    DEFAULT_MAX_CONNECTIONS,
+    create_async_pool,
+    create_pool,
+    get_pool,
+)
+
+# Fallback for servers without BLMPOP (Redis < 7.0): pops up to ARGV[1] elements
+# from the right end of the list, in the order RPOP would return them.
+_POP_MANY_SCRIPT = """
+local items = redis.call('LRANGE', KEYS[1], -tonumber(ARGV[1]), -1)
+if #items > 0 then
+    redis.call('LTRIM', KEYS[1], 0, -#items - 1)
+end
+local popped = {}
+for i = #items, 1, -1 do
+    popped[#popped + 1] = items[i]
+end
+return popped
+"""
+
+_MSGPACK_DECODE = msgspec.msgpack.Decoder().decode
+
+
+def _decode_msgpack(raw: bytes) -> object:
+    """
+    Decodes a msgpack message, falling back to JSON for messages queued before
+    msgpack became the default serializer.
+
+    Args:
+        raw (bytes): Message popped from the queue.
+
+    Returns:
+        object: The decoded message.
+
+    Raises:
+        orjson.JSONDecodeError: If the message is neither msgpack nor JSON.
+    """
+    try:
+        return _MSGPACK_DECODE(raw)
+    except msgspec.DecodeError:
+        return orjson.loads(raw)
+
+
+# Wire formats supported by RedisQueueManager: (encode, decode, decode error).
+_SERIALIZERS = {
+    "msgpack": (
+        msgspec.msgpack.Encoder().encode,
+        _decode_msgpack,
+        orjson.JSONDecodeError,
+    ),
+    "json": (dumps_json, orjson.loads, orjson.JSONDecodeError),
+}
+
+
+class AutoPipeliner:
+    """
+    Coalesces commands submitted from any thread within a short window into a
+    single non-transactional pipeline round trip.
+
+    Attributes:
+        redis_client (redis.StrictRedis): Redis client used to create the pipelines.
+        window (float): Seconds to wait after the first pending command before flushing.
+    """
+
+    def __init__(self, redis_client: redis.StrictRedis, window: float = 0.001):
+        """
+        Initializes the AutoPipeliner.
+
+        Args:
+            redis_client (redis.StrictRedis): Redis client used to create the pipelines.
+            window (float): Seconds to wait after the first pending command before flushing.
+        """
+        self.redis_client = redis_client
+        self.window = window
+        self._pending = []
+        self._lock = threading.Lock()
+        # Held from taking the pending commands until they are sent, so batches
+        # reach Redis in the order they were submitted
+        self._flush_lock = threading.Lock()
+        self._timer = None
+
+    def submit(self, command: str, *args, **kwargs) -> Future:
+        """
+        Queues a command to be sent with the next flush.
+
+        Args:
+            command (str): Name of the redis-py client method (e.g. "rpush").
+            args: Positional arguments for the command.
+            kwargs: Keyword arguments for the command.
+
+        Returns:
+            Future: Resolved with the command reply, or with its error, once flushed.
+        """
+        future = Future()
+        with self._lock:
+            self._pending.append((command, args, kwargs, future))
+            if self._timer is None:
+                self._timer = threading.Timer(self.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        return future
+
+    def flush(self) -> None:
+        """
+        Sends every pending command in one pipeline and resolves their futures.
+
+        Concurrent flushes, from the timer and from callers, run one at a time.
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+
+            if not pending:
+                return
+
+            try:
+                with self.redis_client.pipeline(transaction=False) as pipe:
+                    for command, args, kwargs, _ in pending:
+                        getattr(pipe, command)(*args, **kwargs)
+                    results = pipe.execute(raise_on_error=False)
+            except redis.RedisError as e:
+                for *_, future in pending:
+                    future.set_exception(e)
+                return
+
+        for (*_, future), result in zip(pending, results):
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+def _noop_log(*args, **kwargs) -> None:
+    """
+    Stand-in for log() when verbose mode is disabled.
+    """
+
 
 class RedisQueueManager:
     """
@@ -12,11 +162,26 @@ class RedisQueueManager:
 
     Attributes:
         poll_interval (int): Interval (in seconds) to poll queues for messages.
-        redis_client (redis.StrictRedis): Redis client instance.
+        host (str): Hostname of the Redis server.
+        port (int): Port number of the Redis server.
+        db (int): Redis database index.
+        unix_socket_path (str | None): Path of the Redis Unix socket, used instead of
+            host and port when set.
+        redis_client (redis.StrictRedis): Redis client instance, created on first use.
         callbacks (dict): Mapping of queue names to their respective callback functions.
         threads (list): List of threads handling queue consumption.
+        consumer_pool (redis.BlockingConnectionPool | None): Pool dedicated to the
+            consumer threads while consumption is running, so blocking pops do not
+            hold connections of the shared pool.
         running (bool): Indicates whether queue consumption is active.
         max_retries (int): Maximum number of retries in case of errors.
+        batch_size (int): Maximum number of messages popped per round trip.
+        prefetch (int): Maximum number of popped batches waiting for a queue's
+            callback thread.
+        auto_pipeline (bool): Whether publish coalesces commands through an AutoPipeliner.
+        use_asyncio (bool): Whether start() consumes every queue from a single asyncio
+            event loop instead of one thread per queue.
+        serializer (str): Wire format of queue messages, "msgpack" or "json".
         verbose (bool): Enables detailed logging if True.
     """
 
@@ -28,6 +193,12 @@ class RedisQueueManager:
         db: int = 0,
         max_retries: int = 3,
         verbose: bool = True,
+        batch_size: int = 64,
+        prefetch: int = 2,
+        auto_pipeline: bool = False,
+        use_asyncio: bool = False,
+        serializer: str = "msgpack",
+        unix_socket_path: str | None = None,
     ) -> None:
         """
         Initializes the RedisQueueManager with connection details.
@@ -39,25 +210,83 @@ class RedisQueueManager:
             db (int): Redis database index.
             max_retries (int): Maximum number of retries in case of errors.
             verbose (bool): Enable detailed logging if True.
+            batch_size (int): Maximum number of messages popped per round trip.
+            prefetch (int): Maximum number of popped batches buffered between a
+                queue's consumer thread and its callback thread. Bounds the memory
+                used when callbacks are slower than Redis.
+            auto_pipeline (bool): If True, publish does not wait for Redis: commands
+                from all threads are coalesced over ~1 ms and sent in one pipeline.
+                Call flush() before exiting so pending messages are not lost.
+            use_asyncio (bool): If True, start() runs one event loop in a dedicated
+                thread with a coroutine per queue, which scales to many low-volume
+                queues. Coroutine callbacks are awaited; plain callbacks run on the
+                loop and should return quickly.
+            serializer (str): Wire format of queue messages: "msgpack" (default) or
+                "json" for consumers that expect JSON. Both are encoded in C.
+            unix_socket_path (str | None): Path of the Redis Unix socket. When set, it
+                is used instead of host and port, avoiding the TCP stack for a local
+                server.
         """
         self.poll_interval = poll_interval
-        self.redis_client = redis.StrictRedis(host=host, port=port, db=db)
+        self.host = host
+        self.port = port
+        self.db = db
+        self.unix_socket_path = unix_socket_path
         self.callbacks = {}
         self.threads = []
+        self.consumer_pool = None
         self.running = False
         self.max_retries = max_retries
+        self.batch_size = batch_size
+        self.prefetch = prefetch
+        self.auto_pipeline = auto_pipeline
+        self.use_asyncio = use_asyncio
+        self._blmpop_supported = True
+        if serializer not in _SERIALIZERS:
+            raise ValueError(f"Unsupported serializer: {serializer}")
+        self.serializer = serializer
+        self._encode, self._decode, self._decode_error = _SERIALIZERS[serializer]
         self.verbose = verbose
+        self.log = self._log_verbose if verbose else _noop_log
+
+    @cached_property
+    def redis_client(self) -> redis.StrictRedis:
+        """
+        Redis client, created on first use on top of the shared connection pool.
+        """
+        return redis.StrictRedis(
+            connection_pool=get_pool(
+                self.host,
+                self.port,
+                self.db,
+                unix_socket_path=self.unix_socket_path,
+            )
+        )
+
+    @cached_property
+    def _auto_pipeliner(self) -> AutoPipeliner:
+        """
+        AutoPipeliner used by publish when auto_pipeline is enabled.
+        """
+        return AutoPipeliner(self.redis_client)
+
+    @cached_property
+    def _pop_many_script(self) -> redis.commands.core.Script:
+        """
+        Cached Lua script used to pop batches on servers without BLMPOP.
+        """
+        return self.redis_client.register_script(_POP_MANY_SCRIPT)
 
-    def log(self, message: str, level: str = "info") -> None:
+    def _log_verbose(self, message: str, *args, level: str = "info") -> None:
         """
-        Logs a message if verbose mode is enabled.
+        Logs a message. Bound as log() when verbose mode is enabled.
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log, with "{}" placeholders for args.
+            args: Values formatted into the message only when it is emitted.
             level (str): The log level (e.g., "info", "warning", "error").
         """
-        if self.verbose:
-            getattr(logger, level)(message)
+        getattr(logger, level)(message, *args)
 
     def on_message(self, queue_name: str):
         """
@@ -71,9 +300,7 @@ class RedisQueueManager:
         """
 
         def decorator(func):
-            if queue_name not in self.callbacks:
-                self.callbacks[queue_name] = func
-            else:
+            if self.callbacks.setdefault(queue_name, func) is not func:
                 raise ValueError(
                     f"A callback is already registered for the queue '{queue_name}'"
                 )
@@ -81,46 +308,390 @@ class RedisQueueManager:
 
         return decorator
 
+    def _pop_batch(self, client: redis.StrictRedis, queue_name: str) -> list:
+        """
+        Pops up to batch_size raw messages from the right end of a queue, waiting at
+        most poll_interval seconds for the first one.
+
+        Uses BLMPOP when the server supports it, otherwise BRPOP followed by a Lua
+        script that drains the rest of the batch.
+
+        Args:
+            client (redis.StrictRedis): Client owned by the calling consumer thread.
+            queue_name (str): The name of the Redis queue.
+
+        Returns:
+            list: The raw messages, empty if the queue stayed empty.
+        """
+        if self._blmpop_supported:
+            try:
+                result = client.blmpop(
+                    self.poll_interval,
+                    1,
+                    queue_name,
+                    direction="RIGHT",
+                    count=self.batch_size,
+                )
+                return result[1] if result else []
+            except redis.ResponseError as e:
+                if "unknown command" not in str(e).lower():
+                    raise
+                self._blmpop_supported = False
+                self.log(
+                    "BLMPOP is not supported by the server, falling back to BRPOP.",
+                    level="warning",
+                )
+
+        item = client.brpop(queue_name, timeout=self.poll_interval)
+        if not item:
+            return []
+        items = [item[1]]
+        if self.batch_size > 1:
+            items += self._pop_many_script(
+                keys=[queue_name], args=[self.batch_size - 1], client=client
+            )
+        return items
+
     def _consume_queue(self, queue_name: str, callback) -> None:
         """
-        Consumes elements from a specific Redis queue and executes its callback.
+        Pops elements from a specific Redis queue and hands them to its callback
+        thread.
+
+        The callback runs in a separate thread fed through a bounded buffer, so the
+        next batch is fetched while the previous one is being processed. Each
+        consumer thread uses its own client on top of the consumer pool, so a
+        blocking pop in one thread never waits behind commands of another.
 
         Args:
             queue_name (str): The name of the Redis queue.
             callback (Callable): The callback function to process queue messages.
         """
-        self.log(f"Starting consumer for queue '{queue_name}'...")
+        self.log("Starting consumer for queue '{}'...", queue_name)
+        client = redis.StrictRedis(connection_pool=self.consumer_pool)
+        buffer = Queue(maxsize=self.prefetch)
+        # Messages the callback thread popped but did not process, if it gives up
+        leftover = []
+        worker = threading.Thread(
+            target=self._dispatch_queue, args=(queue_name, callback, buffer, leftover)
+        )
+        worker.daemon = True
+        worker.start()
         retries = 0
 
-        while self.running:
+        # Bound once so the loop only touches local variables.
+        pop_batch = self._pop_batch
+        put = buffer.put
+        poll_interval = self.poll_interval
+
+        batch = []
+        while self.running and worker.is_alive():
             try:
-                item = self.redis_client.brpop(queue_name, timeout=self.poll_interval)
-                if item:
-                    data = json.loads(item[1])
-                    self.log(f"Consumed from '{queue_name}': {data}")
+                batch = pop_batch(client, queue_name)
+            except Exception as e:
+                self.log(
+                    "Error consuming from queue '{}': {}", queue_name, e, level="error"
+                )
+                retries += 1
+                if retries >= self.max_retries:
+                    self.log(
+                        "Maximum retry attempts reached for queue '{}'.",
+                        queue_name,
+                        level="error",
+                    )
+                    break
+                continue
+
+            # Popped messages are already gone from Redis: keep offering them to
+            # the callback thread for as long as it is alive, even while stopping.
+            while batch and worker.is_alive():
+                try:
+                    put(batch, timeout=poll_interval)
+                    batch = []
+                except Full:
+                    continue
+
+        while worker.is_alive():
+            try:
+                put(None, timeout=poll_interval)
+                break
+            except Full:
+                continue
+        worker.join()
+
+        # If the callback thread gave up, return everything it did not process,
+        # in the order it was popped, instead of dropping it.
+        while not buffer.empty():
+            leftover.extend(buffer.get_nowait() or ())
+        self._requeue(client, queue_name, leftover + batch)
+
+    def _dispatch_queue(
+        self, queue_name: str, callback, buffer: Queue, leftover: list
+    ) -> None:
+        """
+        Runs the callback of a queue on the batches popped by its consumer thread,
+        until it receives None.
+
+        A callback error is logged and counted as a retry, and the next message is
+        processed; once max_retries is reached the rest of the batch is left over.
+
+        Args:
+            queue_name (str): The name of the Redis queue.
+            callback (Callable): The callback function to process queue messages.
+            buffer (Queue): Batches of raw messages popped by the consumer thread.
+            leftover (list): Receives the unprocessed messages of the current batch
+                when max_retries is reached, for the consumer thread to push back.
+        """
+        retries = 0
+
+        # Bound once so the per-message loop only touches local variables.
+        get = buffer.get
+        decode = self._decode
+        decode_error = self._decode_error
+        log = self.log
+
+        max_retries = self.max_retries
+
+        while (batch := get()) is not None:
+            for index, raw in enumerate(batch):
+                try:
+                    data = decode(raw)
+                except decode_error as e:
+                    log(
+                        "Error decoding message from queue '{}': {}",
+                        queue_name,
+                        e,
+                        level="error",
+                    )
+                    continue
+                log("Consumed from '{}': {}", queue_name, data)
+                try:
                     callback(data)
-                else:
-                    pass  # Queue is empty
-            except json.JSONDecodeError as e:
+                except Exception as e:
+                    log(
+                        "Error processing message from queue '{}': {}",
+                        queue_name,
+                        e,
+                        level="error",
+                    )
+                    retries += 1
+                    if retries >= max_retries:
+                        self.log(
+                            "Maximum retry attempts reached for queue '{}'.",
+                            queue_name,
+                            level="error",
+                        )
+                        leftover.extend(batch[index + 1 :])
+                        return
+
+    def _requeue(
+        self, client: redis.StrictRedis, queue_name: str, messages: list
+    ) -> None:
+        """
+        Pushes popped but unprocessed raw messages back onto the right end of a
+        queue, so they are popped again first and in the same order.
+
+        Args:
+            client (redis.StrictRedis): Client used to push the messages.
+            queue_name (str): The name of the Redis queue.
+            messages (list): Raw messages, in the order they were popped.
+        """
+        if not messages:
+            return
+        try:
+            client.rpush(queue_name, *reversed(messages))
+            self.log(
+                "Returned {} unprocessed messages to queue '{}'.",
+                len(messages),
+                queue_name,
+                level="warning",
+            )
+        except redis.RedisError as e:
+            self.log(
+                "Error returning {} messages to queue '{}': {}",
+                len(messages),
+                queue_name,
+                e,
+                level="error",
+            )
+
+    async def _requeue_async(
+        self, client: redis.asyncio.StrictRedis, queue_name: str, messages: list
+    ) -> None:
+        """
+        Asyncio counterpart of _requeue.
+
+        Args:
+            client (redis.asyncio.StrictRedis): Client of the running event loop.
+            queue_name (str): The name of the Redis queue.
+            messages (list): Raw messages, in the order they were popped.
+        """
+        if not messages:
+            return
+        try:
+            await client.rpush(queue_name, *reversed(messages))
+            self.log(
+                "Returned {} unprocessed messages to queue '{}'.",
+                len(messages),
+                queue_name,
+                level="warning",
+            )
+        except redis.RedisError as e:
+            self.log(
+                "Error returning {} messages to queue '{}': {}",
+                len(messages),
+                queue_name,
+                e,
+                level="error",
+            )
+
+    async def _pop_batch_async(
+        self, client: redis.asyncio.StrictRedis, queue_name: str, pop_many
+    ) -> list:
+        """
+        Asyncio counterpart of _pop_batch.
+
+        Args:
+            client (redis.asyncio.StrictRedis): Client of the running event loop.
+            queue_name (str): The name of the Redis queue.
+            pop_many (redis.commands.core.AsyncScript): The fallback batch-pop script
+                registered on the client.
+
+        Returns:
+            list: The raw messages, empty if the queue stayed empty.
+        """
+        if self._blmpop_supported:
+            try:
+                result = await client.blmpop(
+                    self.poll_interval,
+                    1,
+                    queue_name,
+                    direction="RIGHT",
+                    count=self.batch_size,
+                )
+                return result[1] if result else []
+            except redis.ResponseError as e:
+                if "unknown command" not in str(e).lower():
+                    raise
+                self._blmpop_supported = False
                 self.log(
-                    f"Error decoding JSON from queue '{queue_name}': {e}",
-                    level="error",
+                    "BLMPOP is not supported by the server, falling back to BRPOP.",
+                    level="warning",
                 )
+
+        item = await client.brpop(queue_name, timeout=self.poll_interval)
+        if not item:
+            return []
+        items = [item[1]]
+        if self.batch_size > 1:
+            items += await pop_many(keys=[queue_name], args=[self.batch_size - 1])
+        return items
+
+    async def _consume_queue_async(
+        self, client: redis.asyncio.StrictRedis, queue_name: str, callback, pop_many
+    ) -> None:
+        """
+        Consumes elements from a specific Redis queue as a coroutine.
+
+        Args:
+            client (redis.asyncio.StrictRedis): Client of the running event loop.
+            queue_name (str): The name of the Redis queue.
+            callback (Callable): The callback function, or coroutine function, to
+                process queue messages.
+            pop_many (redis.commands.core.AsyncScript): The fallback batch-pop script
+                registered on the client.
+        """
+        self.log("Starting async consumer for queue '{}'...", queue_name)
+        is_coroutine = asyncio.iscoroutinefunction(callback)
+        retries = 0
+
+        while self.running and retries < self.max_retries:
+            try:
+                batch = await self._pop_batch_async(client, queue_name, pop_many)
             except Exception as e:
                 self.log(
-                    f"Error consuming from queue '{queue_name}': {e}", level="error"
+                    "Error consuming from queue '{}': {}", queue_name, e, level="error"
                 )
                 retries += 1
-                if retries >= self.max_retries:
+                continue
+
+            for index, raw in enumerate(batch):
+                try:
+                    data = self._decode(raw)
+                except self._decode_error as e:
                     self.log(
-                        f"Maximum retry attempts reached for queue '{queue_name}'.",
+                        "Error decoding message from queue '{}': {}",
+                        queue_name,
+                        e,
                         level="error",
                     )
-                    break
+                    continue
+                self.log("Consumed from '{}': {}", queue_name, data)
+                try:
+                    if is_coroutine:
+                        await callback(data)
+                    else:
+                        callback(data)
+                except Exception as e:
+                    self.log(
+                        "Error processing message from queue '{}': {}",
+                        queue_name,
+                        e,
+                        level="error",
+                    )
+                    retries += 1
+                    if retries >= self.max_retries:
+                        await self._requeue_async(
+                            client, queue_name, batch[index + 1 :]
+                        )
+                        break
+
+        if retries >= self.max_retries:
+            self.log(
+                "Maximum retry attempts reached for queue '{}'.",
+                queue_name,
+                level="error",
+            )
+
+    async def run_forever(self) -> None:
+        """
+        Consumes every registered queue from the current event loop until stop() is
+        called.
+
+        Each queue gets its own coroutine; blocking pops are awaited, so one loop
+        serves any number of queues. Can be awaited directly from an asyncio
+        application, or run in a dedicated thread by start() when use_asyncio is set.
+        """
+        self.running = True
+        pool = create_async_pool(
+            self.host,
+            self.port,
+            self.db,
+            unix_socket_path=self.unix_socket_path,
+            max_connections=max(DEFAULT_MAX_CONNECTIONS, 2 * len(self.callbacks)),
+        )
+        client = redis.asyncio.StrictRedis(connection_pool=pool)
+        pop_many = client.register_script(_POP_MANY_SCRIPT)
+
+        try:
+            await asyncio.gather(
+                *(
+                    asyncio.create_task(
+                        self._consume_queue_async(
+                            client, queue_name, callback, pop_many
+                        )
+                    )
+                    for queue_name, callback in self.callbacks.items()
+                )
+            )
+        finally:
+            await pool.disconnect()
 
     def start(self) -> None:
         """
         Starts parallel consumption for all registered queues.
+
+        Uses a consumer and a callback thread per queue, or a single thread running an asyncio event loop
+        when use_asyncio is set.
         """
         if self.running:
             self.log("Consumption is already running.", level="warning")
@@ -129,6 +700,22 @@ class RedisQueueManager:
         self.running = True
         self.threads = []
 
+        if self.use_asyncio:
+            thread = threading.Thread(target=asyncio.run, args=(self.run_forever(),))
+            thread.daemon = True
+            self.threads.append(thread)
+            thread.start()
+            self.log("Event loop thread started for {} queues.", len(self.callbacks))
+            return
+
+        self.consumer_pool = create_pool(
+            self.host,
+            self.port,
+            self.db,
+            unix_socket_path=self.unix_socket_path,
+            max_connections=max(DEFAULT_MAX_CONNECTIONS, 2 * len(self.callbacks)),
+        )
+
         for queue_name, callback in self.callbacks.items():
             thread = threading.Thread(
                 target=self._consume_queue, args=(queue_name, callback)
@@ -136,7 +723,7 @@ class RedisQueueManager:
             thread.daemon = True
             self.threads.append(thread)
             thread.start()
-            self.log(f"Thread started for queue '{queue_name}'.")
+            self.log("Thread started for queue '{}'.", queue_name)
 
     def stop(self) -> None:
         """
@@ -150,27 +737,103 @@ class RedisQueueManager:
         for thread in self.threads:
             if thread.is_alive():
                 thread.join()
+        if self.consumer_pool is not None:
+            self.consumer_pool.disconnect()
+            self.consumer_pool = None
         self.log("All threads have been stopped.")
 
     def publish(self, queue_name: str, data: dict, ttl: int = -1) -> None:
         """
         Publishes a message to a Redis queue with an optional TTL.
 
+        The RPUSH and the optional EXPIRE are sent together in one round trip.
+
         Args:
             queue_name (str): The name of the Redis queue.
-            data (dict): The message to publish, serialized to JSON.
+            data (dict): The message to publish, serialized with the
+                configured serializer.
             ttl (int): Time-to-live for the message in seconds. If -1, no TTL is set.
         """
         try:
-            json_data = json.dumps(data)
-            self.redis_client.rpush(queue_name, json_data)
-            self.log(f"Published to queue '{queue_name}': {data}")
+            payload = self._encode(data)
+
+            if self.auto_pipeline:
+                future = self._auto_pipeliner.submit("rpush", queue_name, payload)
+                future.add_done_callback(
+                    lambda f: self._log_publish_error(queue_name, f)
+                )
+                if ttl > 0:
+                    self._auto_pipeliner.submit("expire", queue_name, ttl)
+            else:
+                with self.redis_client.pipeline(transaction=False) as p:
+                    p.rpush(queue_name, payload)
+                    if ttl > 0:
+                        p.expire(queue_name, ttl)
+                    p.execute()
 
+            self.log("Published to queue '{}': {}", queue_name, data)
             if ttl > 0:
-                self.redis_client.expire(queue_name, ttl)
-                self.log(f"Set TTL of {ttl} seconds for queue '{queue_name}'")
+                self.log("Set TTL of {} seconds for queue '{}'", ttl, queue_name)
         except Exception as e:
-            self.log(f"Error publishing to queue '{queue_name}': {e}", level="error")
+            self.log("Error publishing to queue '{}': {}", queue_name, e, level="error")
+
+    def publish_many(self, queue_name: str, data_iter, ttl: int = -1) -> int:
+        """
+        Publishes several messages to a Redis queue in one round trip.
+
+        All payloads are sent in a single variadic RPUSH, pipelined with the
+        optional EXPIRE.
+
+        Args:
+            queue_name (str): The name of the Redis queue.
+            data_iter (Iterable[dict]): The messages to publish, in order.
+            ttl (int): Time-to-live for the queue in seconds. If -1, no TTL is set.
+
+        Returns:
+            int: The number of messages published.
+        """
+        try:
+            encode = self._encode
+            payloads = [encode(data) for data in data_iter]
+            if not payloads:
+                return 0
+
+            with self.redis_client.pipeline(transaction=False) as p:
+                p.rpush(queue_name, *payloads)
+                if ttl > 0:
+                    p.expire(queue_name, ttl)
+                p.execute()
+
+            self.log("Published {} messages to queue '{}'", len(payloads), queue_name)
+            if ttl > 0:
+                self.log("Set TTL of {} seconds for queue '{}'", ttl, queue_name)
+            return len(payloads)
+        except Exception as e:
+            self.log("Error publishing to queue '{}': {}", queue_name, e, level="error")
+            return 0
+
+    def _log_publish_error(self, queue_name: str, future: Future) -> None:
+        """
+        Logs the error of an auto-pipelined publish, if it failed.
+
+        Args:
+            queue_name (str): The name of the Redis queue.
+            future (Future): Future of the RPUSH command.
+        """
+        if future.exception() is not None:
+            self.log(
+                "Error publishing to queue '{}': {}",
+                queue_name,
+                future.exception(),
+                level="error",
+            )
+
+    def flush(self) -> None:
+        """
+        Sends the commands still pending in the auto-pipeline, if enabled.
+        """
+        if self.auto_pipeline:
+            self._auto_pipeliner.flush()
 
     def get_queue_length(self, queue_name: str) -> int:
         """
@@ -184,14 +847,38 @@ class RedisQueueManager:
         """
         try:
             length = self.redis_client.llen(queue_name)
-            self.log(f"Length of queue '{queue_name}': {length}")
+            self.log("Length of queue '{}': {}", queue_name, length)
             return length
         except Exception as e:
             self.log(
-                f"Error retrieving length of queue '{queue_name}': {e}", level="error"
+                "Error retrieving length of queue '{}': {}",
+                queue_name,
+                e,
+                level="error",
             )
             return 0
 
+    def get_queue_lengths(self, queue_names: list[str]) -> list[int]:
+        """
+        Retrieves the lengths of several Redis queues in one round trip.
+
+        Args:
+            queue_names (list[str]): The names of the Redis queues.
+
+        Returns:
+            list[int]: The number of elements in each queue, in the given order.
+        """
+        try:
+            with self.redis_client.pipeline(transaction=False) as p:
+                for queue_name in queue_names:
+                    p.llen(queue_name)
+                lengths = p.execute()
+            self.log("Lengths of queues {}: {}", queue_names, lengths)
+            return lengths
+        except Exception as e:
+            self.log("Error retrieving lengths of queues: {}", e, level="error")
+            return [0] * len(queue_names)
+
     def wait(self) -> None:
         """
         Keeps the program running while consumption is active without using while True.
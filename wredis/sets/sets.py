@@ -1,6 +1,32 @@
+from __future__ import annotations
+
 import redis
+from functools import cached_property
 from loguru import logger
 
+from .._pool import get_pool
+
+# Adds ARGV[2..n] to a set and, when ARGV[1] is positive, sets its TTL in the
+# same call. Returns the number of members added.
+_SADD_TTL_SCRIPT = """
+local added = 0
+-- unpack() is limited by Lua's stack size, so members are added in chunks
+for first = 2, #ARGV, 5000 do
+    local last = math.min(first + 4999, #ARGV)
+    added = added + redis.call('SADD', KEYS[1], unpack(ARGV, first, last))
+end
+if tonumber(ARGV[1]) > 0 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return added
+"""
+
+
+def _noop_log(*args, **kwargs) -> None:
+    """
+    Stand-in for log() when verbose mode is disabled.
+    """
+
 
 class RedisSetManager:
     """
@@ -8,7 +34,12 @@ class RedisSetManager:
     removing elements, and managing TTL (Time-to-Live) for set keys.
 
     Attributes:
-        redis_client (redis.StrictRedis): Redis client instance.
+        host (str): Hostname of the Redis server.
+        port (int): Port number of the Redis server.
+        db (int): Redis database index.
+        unix_socket_path (str | None): Path of the Redis Unix socket, used instead of
+            host and port when set.
+        redis_client (redis.StrictRedis): Redis client instance, created on first use.
         verbose (bool): Enables detailed logging if True.
     """
 
@@ -18,6 +49,7 @@ class RedisSetManager:
         port: int = 6379,
         db: int = 0,
         verbose: bool = True,
+        unix_socket_path: str | None = None,
     ):
         """
         Initializes the RedisSetManager with connection details.
@@ -27,37 +59,69 @@ class RedisSetManager:
             port (int): Port number of the Redis server.
             db (int): Redis database index.
             verbose (bool): Enable detailed logging if True.
-        """
-        self.redis_client = redis.StrictRedis(host=host, port=port, db=db)
+            unix_socket_path (str | None): Path of the Redis Unix socket. When set, it
+                is used instead of host and port, avoiding the TCP stack for a local
+                server.
+        """
+        self.host = host
+        self.port = port
+        self.db = db
+        self.unix_socket_path = unix_socket_path
         self.verbose = verbose
+        self.log = self._log_verbose if verbose else _noop_log
+
+    @cached_property
+    def redis_client(self) -> redis.StrictRedis:
+        """
+        Redis client, created on first use on top of the shared connection pool.
 
-    def log(self, message: str, level: str = "info") -> None:
+        Replies are decoded to str by the protocol parser.
         """
-        Logs a message if verbose mode is enabled.
+        return redis.StrictRedis(
+            connection_pool=get_pool(
+                self.host,
+                self.port,
+                self.db,
+                decode_responses=True,
+                unix_socket_path=self.unix_socket_path,
+            )
+        )
+
+    @cached_property
+    def _sadd_ttl_script(self) -> redis.commands.core.Script:
+        """
+        Cached Lua script used by add_to_set, registered on first use.
+        """
+        return self.redis_client.register_script(_SADD_TTL_SCRIPT)
+
+    def _log_verbose(self, message: str, *args, level: str = "info") -> None:
+        """
+        Logs a message. Bound as log() when verbose mode is enabled.
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log, with "{}" placeholders for args.
+            args: Values formatted into the message only when it is emitted.
             level (str): The log level (e.g., "info", "warning", "error").
         """
-        if self.verbose:
-            getattr(logger, level)(message)
+        getattr(logger, level)(message, *args)
 
     def add_to_set(self, key: str, *values: str, ttl: int = -1) -> None:
         """
         Adds one or more elements to a set and optionally sets a TTL.
 
+        Both happen in a single server-side script call.
+
         Args:
             key (str): Name of the set in Redis.
             values (str): Elements to add to the set.
             ttl (int): Time-to-live for the set in seconds. If -1, no TTL is set.
         """
         try:
-            self.redis_client.sadd(key, *values)
-            self.log(f"Added to set '{key}': {values}")
+            self._sadd_ttl_script(keys=[key], args=[ttl, *values])
+            self.log("Added to set '{}': {}", key, values)
 
             if ttl > 0:
-                self.redis_client.expire(key, ttl)
-                self.log(f"Set TTL of {ttl} seconds for set '{key}'")
+                self.log("Set TTL of {} seconds for set '{}'", ttl, key)
         except Exception as e:
             logger.error(f"Error adding to set '{key}': {e}")
 
@@ -69,11 +133,11 @@ class RedisSetManager:
             key (str): Name of the set in Redis.
 
         Returns:
-            set: A set of decoded members.
+            set: The members of the set.
         """
         try:
-            members = {member.decode() for member in self.redis_client.smembers(key)}
-            self.log(f"Members of set '{key}': {members}")
+            members = self.redis_client.smembers(key)
+            self.log("Members of set '{}': {}", key, members)
             return members
         except Exception as e:
             logger.error(f"Error retrieving members of set '{key}': {e}")
@@ -93,7 +157,10 @@ class RedisSetManager:
         try:
             result = self.redis_client.sismember(key, value)
             self.log(
-                f"Element '{value}' {'is' if result else 'is not'} a member of set '{key}'"
+                "Element '{}' {} a member of set '{}'",
+                value,
+                "is" if result else "is not",
+                key,
             )
             return result
         except Exception as e:
@@ -110,7 +177,7 @@ class RedisSetManager:
         """
         try:
             self.redis_client.srem(key, *values)
-            self.log(f"Removed from set '{key}': {values}")
+            self.log("Removed from set '{}': {}", key, values)
         except Exception as e:
             logger.error(f"Error removing from set '{key}': {e}")
 
@@ -127,11 +194,11 @@ class RedisSetManager:
         try:
             ttl = self.redis_client.ttl(key)
             if ttl == -1:
-                self.log(f"Set '{key}' has no TTL set.", level="warning")
+                self.log("Set '{}' has no TTL set.", key, level="warning")
             elif ttl == -2:
-                self.log(f"Set '{key}' does not exist.", level="warning")
+                self.log("Set '{}' does not exist.", key, level="warning")
             else:
-                self.log(f"TTL for set '{key}' is {ttl} seconds.")
+                self.log("TTL for set '{}' is {} seconds.", key, ttl)
             return ttl
         except Exception as e:
             logger.error(f"Error retrieving TTL for set '{key}': {e}")
@@ -146,12 +213,12 @@ class RedisSetManager:
             ttl (int): New TTL in seconds.
         """
         try:
-            if self.redis_client.exists(key):
-                self.redis_client.expire(key, ttl)
-                self.log(f"Extended TTL for set '{key}' to {ttl} seconds.")
+            if self.redis_client.expire(key, ttl):
+                self.log("Extended TTL for set '{}' to {} seconds.", key, ttl)
             else:
                 self.log(
-                    f"Cannot set TTL because set '{key}' does not exist.",
+                    "Cannot set TTL because set '{}' does not exist.",
+                    key,
                     level="warning",
                 )
         except Exception as e:
@@ -1,6 +1,27 @@
+from __future__ import annotations
+
 import redis
+from functools import cached_property
 from loguru import logger
-from typing import List, Optional, Union, Tuple
+from typing import Dict, Iterator, List, Optional, Union, Tuple
+
+from .._pool import get_pool
+
+# Adds a member with its score (ARGV[2], ARGV[3]) and, when ARGV[1] is positive,
+# sets the TTL in the same call. Returns the number of members added.
+_ZADD_TTL_SCRIPT = """
+local added = redis.call('ZADD', KEYS[1], ARGV[2], ARGV[3])
+if tonumber(ARGV[1]) > 0 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return added
+"""
+
+
+def _noop_log(*args, **kwargs) -> None:
+    """
+    Stand-in for log() when verbose mode is disabled.
+    """
 
 
 class RedisSortedSetManager:
@@ -8,7 +29,12 @@ class RedisSortedSetManager:
     Manages Redis sorted sets, allowing operations such as adding, removing, retrieving, and managing TTL for sorted sets.
 
     Attributes:
-        redis_client (redis.StrictRedis): Redis client instance.
+        host (str): Hostname of the Redis server.
+        port (int): Port number of the Redis server.
+        db (int): Redis database index.
+        unix_socket_path (Optional[str]): Path of the Redis Unix socket, used
+            instead of host and port when set.
+        redis_client (redis.StrictRedis): Redis client instance, created on first use.
         verbose (bool): Enables detailed logging if True.
     """
 
@@ -18,6 +44,7 @@ class RedisSortedSetManager:
         port: int = 6379,
         db: int = 0,
         verbose: bool = True,
+        unix_socket_path: Optional[str] = None,
     ):
         """
         Initializes the RedisSortedSetManager with connection details.
@@ -27,20 +54,51 @@ class RedisSortedSetManager:
             port (int): Port number of the Redis server.
             db (int): Redis database index.
             verbose (bool): Enable detailed logging if True.
+            unix_socket_path (Optional[str]): Path of the Redis Unix socket. When
+                set, it is used instead of host and port, avoiding the TCP stack for
+                a local server.
         """
-        self.redis_client = redis.StrictRedis(host=host, port=port, db=db)
+        self.host = host
+        self.port = port
+        self.db = db
+        self.unix_socket_path = unix_socket_path
         self.verbose = verbose
+        self.log = self._log_verbose if verbose else _noop_log
 
-    def log(self, message: str, level: str = "info") -> None:
+    @cached_property
+    def redis_client(self) -> redis.StrictRedis:
+        """
+        Redis client, created on first use on top of the shared connection pool.
+
+        Replies are decoded to str by the protocol parser.
+        """
+        return redis.StrictRedis(
+            connection_pool=get_pool(
+                self.host,
+                self.port,
+                self.db,
+                decode_responses=True,
+                unix_socket_path=self.unix_socket_path,
+            )
+        )
+
+    @cached_property
+    def _zadd_ttl_script(self) -> redis.commands.core.Script:
+        """
+        Cached Lua script used by add_to_sorted_set, registered on first use.
         """
-        Logs a message if verbose mode is enabled.
+        return self.redis_client.register_script(_ZADD_TTL_SCRIPT)
+
+    def _log_verbose(self, message: str, *args, level: str = "info") -> None:
+        """
+        Logs a message. Bound as log() when verbose mode is enabled.
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log, with "{}" placeholders for args.
+            args: Values formatted into the message only when it is emitted.
             level (str): The log level (e.g., "info", "warning", "error").
         """
-        if self.verbose:
-            getattr(logger, level)(message)
+        getattr(logger, level)(message, *args)
 
     def add_to_sorted_set(
         self, key: str, score: float, member: str, ttl: int = -1
@@ -48,6 +106,8 @@ class RedisSortedSetManager:
         """
         Adds an element to the sorted set with its score and optionally sets a TTL.
 
+        Both happen in a single server-side script call.
+
         Args:
             key (str): Name of the sorted set in Redis.
             score (float): Score associated with the member.
@@ -55,44 +115,92 @@ class RedisSortedSetManager:
             ttl (int): Time-to-live in seconds for the sorted set. If -1, no TTL is set.
         """
         try:
-            self.redis_client.zadd(key, {member: score})
-            self.log(f"Added to sorted set '{key}': {member} with score {score}")
+            self._zadd_ttl_script(keys=[key], args=[ttl, score, member])
+            self.log("Added to sorted set '{}': {} with score {}", key, member, score)
 
             if ttl > 0:
-                self.redis_client.expire(key, ttl)
-                self.log(f"Set TTL of {ttl} seconds for sorted set '{key}'")
+                self.log("Set TTL of {} seconds for sorted set '{}'", ttl, key)
         except Exception as e:
             logger.error(f"Error adding to sorted set '{key}': {e}")
 
-    def get_sorted_set(
-        self, key: str, start: int = 0, stop: int = -1, with_scores: bool = False
+    def add_many(self, key: str, mapping: Dict[str, float], ttl: int = -1) -> None:
+        """
+        Adds or updates several members of the sorted set in one round trip.
+
+        A single ZADD carries every member, pipelined with the optional EXPIRE.
+
+        Args:
+            key (str): Name of the sorted set in Redis.
+            mapping (Dict[str, float]): Scores by member.
+            ttl (int): Time-to-live in seconds for the sorted set. If -1, no TTL is set.
+        """
+        if not mapping:
+            return
+
+        try:
+            with self.redis_client.pipeline(transaction=False) as p:
+                p.zadd(key, mapping)
+                if ttl > 0:
+                    p.expire(key, ttl)
+                p.execute()
+            self.log("Added {} members to sorted set '{}'", len(mapping), key)
+
+            if ttl > 0:
+                self.log("Set TTL of {} seconds for sorted set '{}'", ttl, key)
+        except Exception as e:
+            logger.error(f"Error adding to sorted set '{key}': {e}")
+
+    def _zrange(
+        self, key: str, start: int, stop: int, with_scores: bool, reverse: bool
     ) -> Union[List[str], List[Tuple[str, float]]]:
         """
-        Retrieves elements from the sorted set in a given range.
+        Retrieves elements from the sorted set by index range, in either order.
 
         Args:
             key (str): Name of the sorted set in Redis.
             start (int): Starting index of the range.
             stop (int): Ending index of the range.
             with_scores (bool): Whether to include scores in the result.
+            reverse (bool): Whether to order members from the highest score.
 
         Returns:
             Union[List[str], List[Tuple[str, float]]]: List of members or tuples of (member, score) if with_scores is True.
         """
+        order = "reverse" if reverse else "ascending"
         try:
-            result = self.redis_client.zrange(key, start, stop, withscores=with_scores)
-
-            if with_scores:
-                result = [(member.decode(), score) for member, score in result]
-            else:
-                result = [member.decode() for member in result]
-
-            self.log(f"Retrieved elements from sorted set '{key}': {result}")
+            result = self.redis_client.zrange(
+                key, start, stop, desc=reverse, withscores=with_scores
+            )
+            self.log(
+                "Retrieved elements in {} order from sorted set '{}': {}",
+                order,
+                key,
+                result,
+            )
             return result
         except Exception as e:
-            logger.error(f"Error retrieving elements from sorted set '{key}': {e}")
+            logger.error(
+                f"Error retrieving elements in {order} order from sorted set '{key}': {e}"
+            )
             return []
 
+    def get_sorted_set(
+        self, key: str, start: int = 0, stop: int = -1, with_scores: bool = False
+    ) -> Union[List[str], List[Tuple[str, float]]]:
+        """
+        Retrieves elements from the sorted set in a given range.
+
+        Args:
+            key (str): Name of the sorted set in Redis.
+            start (int): Starting index of the range.
+            stop (int): Ending index of the range.
+            with_scores (bool): Whether to include scores in the result.
+
+        Returns:
+            Union[List[str], List[Tuple[str, float]]]: List of members or tuples of (member, score) if with_scores is True.
+        """
+        return self._zrange(key, start, stop, with_scores, reverse=False)
+
     def get_sorted_set_reverse(
         self, key: str, start: int = 0, stop: int = -1, with_scores: bool = False
     ) -> Union[List[str], List[Tuple[str, float]]]:
@@ -108,24 +216,7 @@ class RedisSortedSetManager:
         Returns:
             Union[List[str], List[Tuple[str, float]]]: List of members or tuples of (member, score) if with_scores is True.
         """
-        try:
-            result = self.redis_client.zrevrange(
-                key, start, stop, withscores=with_scores
-            )
-            if with_scores:
-                result = [(member.decode(), score) for member, score in result]
-            else:
-                result = [member.decode() for member in result]
-
-            self.log(
-                f"Retrieved elements in reverse order from sorted set '{key}': {result}"
-            )
-            return result
-        except Exception as e:
-            logger.error(
-                f"Error retrieving elements in reverse from sorted set '{key}': {e}"
-            )
-            return []
+        return self._zrange(key, start, stop, with_scores, reverse=True)
 
     def remove_from_sorted_set(self, key: str, member: str) -> None:
         """
@@ -137,7 +228,7 @@ class RedisSortedSetManager:
         """
         try:
             self.redis_client.zrem(key, member)
-            self.log(f"Removed from sorted set '{key}': {member}")
+            self.log("Removed from sorted set '{}': {}", key, member)
         except Exception as e:
             logger.error(f"Error removing from sorted set '{key}': {e}")
 
@@ -154,7 +245,7 @@ class RedisSortedSetManager:
         """
         try:
             rank = self.redis_client.zrank(key, member)
-            self.log(f"Rank of '{member}' in sorted set '{key}': {rank}")
+            self.log("Rank of '{}' in sorted set '{}': {}", member, key, rank)
             return rank
         except Exception as e:
             logger.error(
@@ -162,6 +253,29 @@ class RedisSortedSetManager:
             )
             return None
 
+    def get_ranks(self, key: str, members: List[str]) -> List[Optional[int]]:
+        """
+        Retrieves the ranks of several members of the sorted set in one round trip.
+
+        Args:
+            key (str): Name of the sorted set in Redis.
+            members (List[str]): Members whose ranks to retrieve.
+
+        Returns:
+            List[Optional[int]]: The rank of each member in the given order, None for
+                members not in the sorted set or if an error occurs.
+        """
+        try:
+            with self.redis_client.pipeline(transaction=False) as p:
+                for member in members:
+                    p.zrank(key, member)
+                ranks = p.execute()
+            self.log("Ranks of {} in sorted set '{}': {}", members, key, ranks)
+            return ranks
+        except Exception as e:
+            logger.error(f"Error retrieving ranks in sorted set '{key}': {e}")
+            return [None] * len(members)
+
     def get_score(self, key: str, member: str) -> Optional[float]:
         """
         Retrieves the score of a member in the sorted set.
@@ -175,7 +289,7 @@ class RedisSortedSetManager:
         """
         try:
             score = self.redis_client.zscore(key, member)
-            self.log(f"Score of '{member}' in sorted set '{key}': {score}")
+            self.log("Score of '{}' in sorted set '{}': {}", member, key, score)
             return score
         except Exception as e:
             logger.error(
@@ -192,7 +306,7 @@ class RedisSortedSetManager:
         """
         try:
             self.redis_client.delete(key)
-            self.log(f"Deleted entire sorted set '{key}'")
+            self.log("Deleted entire sorted set '{}'", key)
         except Exception as e:
             logger.error(f"Error deleting sorted set '{key}': {e}")
 
@@ -205,9 +319,8 @@ class RedisSortedSetManager:
             ttl (int): Time-to-live in seconds.
         """
         try:
-            if self.redis_client.exists(key):
-                self.redis_client.expire(key, ttl)
-                self.log(f"Set TTL of {ttl} seconds for sorted set '{key}'")
+            if self.redis_client.expire(key, ttl):
+                self.log("Set TTL of {} seconds for sorted set '{}'", ttl, key)
             else:
                 logger.warning(f"Sorted set '{key}' does not exist to set TTL.")
         except Exception as e:
@@ -226,11 +339,11 @@ class RedisSortedSetManager:
         try:
             ttl = self.redis_client.ttl(key)
             if ttl == -1:
-                self.log(f"Sorted set '{key}' has no TTL set.", level="warning")
+                self.log("Sorted set '{}' has no TTL set.", key, level="warning")
             elif ttl == -2:
-                self.log(f"Sorted set '{key}' does not exist.", level="warning")
+                self.log("Sorted set '{}' does not exist.", key, level="warning")
             else:
-                self.log(f"TTL for sorted set '{key}' is {ttl} seconds.")
+                self.log("TTL for sorted set '{}' is {} seconds.", key, ttl)
             return ttl
         except Exception as e:
             logger.error(f"Error retrieving TTL for sorted set '{key}': {e}")
@@ -248,13 +361,77 @@ class RedisSortedSetManager:
         try:
             self.redis_client.zincrby(key, increment, member)
             self.log(
-                f"Incremented score of '{member}' by {increment} in sorted set '{key}'"
+                "Incremented score of '{}' by {} in sorted set '{}'",
+                member,
+                increment,
+                key,
             )
         except Exception as e:
             logger.error(
                 f"Error incrementing score of '{member}' in sorted set '{key}': {e}"
             )
 
+    def iter_by_score(
+        self,
+        key: str,
+        min_score: float,
+        max_score: float,
+        with_scores: bool = False,
+        page: int = 1000,
+    ) -> Iterator[Union[str, Tuple[str, float]]]:
+        """
+        Iterates over members of the sorted set within a specific score range,
+        fetching them in pages with ZRANGEBYSCORE.
+
+        Pages are addressed by a score cursor, the last score returned plus the
+        number of members already returned at that score, so each page costs the
+        same however far the iteration has gone. Memory use is bounded by the page
+        size, both in Redis's reply buffer and in the client. The iteration is not
+        a snapshot: members written meanwhile may or may not be returned, and a
+        Redis error ends it early after being logged.
+
+        Args:
+            key (str): Name of the sorted set in Redis.
+            min_score (float): Minimum score (inclusive).
+            max_score (float): Maximum score (inclusive).
+            with_scores (bool): Whether to include scores in the result.
+            page (int): Number of members fetched per round trip.
+
+        Yields:
+            Union[str, Tuple[str, float]]: Each member, or (member, score) if with_scores is True.
+        """
+        if page <= 0:
+            raise ValueError(f"page must be a positive integer, got {page}")
+
+        low, skip = min_score, 0
+        try:
+            while True:
+                batch = self.redis_client.zrangebyscore(
+                    key, low, max_score, start=skip, num=page, withscores=True
+                )
+                if with_scores:
+                    yield from batch
+                else:
+                    yield from (member for member, _ in batch)
+                if len(batch) < page:
+                    return
+
+                last_score = batch[-1][1]
+                ties = 0
+                for _, score in reversed(batch):
+                    if score != last_score:
+                        break
+                    ties += 1
+                if ties == len(batch) and last_score == low:
+                    # The whole page shares the cursor's score
+                    skip += ties
+                else:
+                    low, skip = last_score, ties
+        except redis.RedisError as e:
+            logger.error(
+                f"Error retrieving elements by score from sorted set '{key}': {e}"
+            )
+
     def get_sorted_set_by_score(
         self, key: str, min_score: float, max_score: float, with_scores: bool = False
     ) -> Union[List[str], List[Tuple[str, float]]]:
@@ -274,11 +451,9 @@ class RedisSortedSetManager:
             result = self.redis_client.zrangebyscore(
                 key, min_score, max_score, withscores=with_scores
             )
-            if with_scores:
-                result = [(member.decode(), score) for member, score in result]
-            else:
-                result = [member.decode() for member in result]
-            self.log(f"Retrieved elements by score from sorted set '{key}': {result}")
+            self.log(
+                "Retrieved elements by score from sorted set '{}': {}", key, result
+            )
             return result
         except Exception as e:
             logger.error(
@@ -1,8 +1,86 @@
+from __future__ import annotations
+
+import asyncio
 import redis
+import redis.asyncio
+from functools import cached_property, partial
 from loguru import logger
 import threading
 import signal
-from typing import Callable, Dict, Optional
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from .._pool import create_async_pool, create_pool, get_pool
+
+
+def _noop_log(*args, **kwargs) -> None:
+    """
+    Stand-in for log() when verbose mode is disabled.
+    """
+
+
+@dataclass
+class ConsumerSpec:
+    """
+    Consumer registered for a stream with on_message.
+
+    Attributes:
+        group_name (str): Name of the consumer group.
+        consumer_name (str): Name of the consumer within the group.
+        callback (Callable): Function called with every message read.
+    """
+
+    # Declared by hand, dataclass(slots=True) needs Python 3.10
+    __slots__ = ("group_name", "consumer_name", "callback")
+
+    group_name: str
+    consumer_name: str
+    callback: Callable
+
+
+class _ReaderIdTracker:
+    """
+    Keeps the client ID of a listener's reader connection up to date.
+
+    Registered as connect callback of the connection, so the ID used by
+    _wake_listener is fetched again whenever the connection is re-established,
+    including the reconnects done transparently by the pool's retry policy.
+    redis-py holds connect callbacks weakly, so the listener keeps the tracker
+    referenced for as long as it runs.
+
+    Attributes:
+        reader_ids (Dict[Tuple[str, str], Optional[int]]): Client IDs by listener.
+        listener_key (Tuple[str, str]): Group and consumer name of the listener.
+    """
+
+    __slots__ = ("reader_ids", "listener_key", "__weakref__")
+
+    def __init__(
+        self,
+        reader_ids: Dict[Tuple[str, str], Optional[int]],
+        listener_key: Tuple[str, str],
+    ):
+        self.reader_ids = reader_ids
+        self.listener_key = listener_key
+
+    def on_connect(self, connection: redis.connection.AbstractConnection) -> None:
+        """
+        Records the client ID of a newly established reader connection.
+        """
+        connection.send_command("CLIENT", "ID")
+        self.reader_ids[self.listener_key] = connection.read_response()
+
+    async def on_connect_async(
+        self, connection: redis.asyncio.connection.AbstractConnection
+    ) -> None:
+        """
+        Asyncio counterpart of on_connect.
+        """
+        await connection.send_command("CLIENT", "ID")
+        self.reader_ids[self.listener_key] = await connection.read_response()
 
 
 class RedisStreamManager:
@@ -10,9 +88,18 @@ class RedisStreamManager:
     Manages Redis streams, allowing message publishing and consumption with support for message groups and TTL.
 
     Attributes:
-        redis_client (redis.StrictRedis): Redis client instance.
+        host (str): Hostname of the Redis server.
+        port (int): Port number of the Redis server.
+        db (int): Redis database index.
+        unix_socket_path (Optional[str]): Path of the Redis Unix socket, used
+            instead of host and port when set.
+        redis_client (redis.StrictRedis): Redis client instance, created on first use.
         verbose (bool): Enables detailed logging if True.
-        consumers (Dict): Dictionary of registered consumers for streams.
+        batch_size (int): Maximum number of messages read per XREADGROUP call.
+        max_workers (int): Number of worker threads that run the callbacks.
+        use_asyncio (bool): Whether streams are read by coroutines on a single event
+            loop thread instead of one thread per group and consumer.
+        consumers (Dict[str, ConsumerSpec]): Registered consumers, by stream name.
         running (bool): Indicates whether the manager is actively consuming messages.
     """
 
@@ -22,6 +109,10 @@ class RedisStreamManager:
         port: int = 6379,
         db: int = 0,
         verbose: bool = True,
+        batch_size: int = 64,
+        max_workers: int = 8,
+        use_asyncio: bool = False,
+        unix_socket_path: Optional[str] = None,
     ):
         """
         Initializes the RedisStreamManager with connection details.
@@ -31,22 +122,91 @@ class RedisStreamManager:
             port (int): Port number of the Redis server.
             db (int): Redis database index.
             verbose (bool): Enable detailed logging if True.
+            batch_size (int): Maximum number of messages read per XREADGROUP call;
+                processed messages are acknowledged in batches.
+            max_workers (int): Number of worker threads that run the callbacks.
+                Messages of a stream may be processed out of order when greater
+                than 1.
+            use_asyncio (bool): If True, one thread runs an event loop with a
+                listener coroutine per group and consumer, which scales to many
+                groups. Coroutine callbacks are awaited; plain callbacks run on the
+                loop and should return quickly. max_workers is not used.
+            unix_socket_path (Optional[str]): Path of the Redis Unix socket. When
+                set, it is used instead of host and port, avoiding the TCP stack for
+                a local server.
         """
-        self.redis_client = redis.StrictRedis(host=host, port=port, db=db)
+        self.host = host
+        self.port = port
+        self.db = db
+        self.unix_socket_path = unix_socket_path
         self.verbose = verbose
-        self.consumers: Dict[str, Dict[str, str]] = {}
-        self.running = False
+        self.log = self._log_verbose if verbose else _noop_log
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.use_asyncio = use_asyncio
+        self._executor = None
+        # Event loop of run_forever and the event that wakes it, set while it runs
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._registered: Optional[asyncio.Event] = None
+        self.consumers: Dict[str, ConsumerSpec] = {}
+        self._listeners: Dict[Tuple[str, str], threading.Thread] = {}
+        self._reader_ids: Dict[Tuple[str, str], Optional[int]] = {}
+        # Messages whose callback succeeded, not acknowledged yet, by listener
+        self._completed: Dict[Tuple[str, str], deque] = {}
+        # Number of registrations each listener has picked up
+        self._registered_counts: Dict[Tuple[str, str], int] = {}
+        # Set by stop_listeners; listener threads and wait() watch it
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        """
+        Whether listener threads are consuming messages.
+
+        Setting it to False tells the listeners to stop without waiting for them,
+        use stop_listeners to also wait for running callbacks. Setting it to True
+        starts listening again to every registered stream.
+        """
+        return bool(self._listeners) and not self._stop.is_set()
+
+    @running.setter
+    def running(self, value: bool) -> None:
+        if not value:
+            self._stop.set()
+            for listener_key in tuple(self._listeners):
+                self._wake_listener(listener_key)
+            self._notify_loop()
+            return
+        for stream_name in tuple(self.consumers):
+            self._start_listener(stream_name)
+
+    @cached_property
+    def redis_client(self) -> redis.StrictRedis:
+        """
+        Redis client, created on first use on top of the shared connection pool.
 
-    def log(self, message: str, level: str = "info") -> None:
+        Replies are decoded to str by the protocol parser.
+        """
+        return redis.StrictRedis(
+            connection_pool=get_pool(
+                self.host,
+                self.port,
+                self.db,
+                decode_responses=True,
+                unix_socket_path=self.unix_socket_path,
+            )
+        )
+
+    def _log_verbose(self, message: str, *args, level: str = "info") -> None:
         """
-        Logs a message if verbose mode is enabled.
+        Logs a message. Bound as log() when verbose mode is enabled.
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log, with "{}" placeholders for args.
+            args: Values formatted into the message only when it is emitted.
             level (str): The log level (e.g., "info", "warning", "error").
         """
-        if self.verbose:
-            getattr(logger, level)(message)
+        getattr(logger, level)(message, *args)
 
     def add_to_stream(
         self, key: str, data: Dict[str, str], ttl: Optional[int] = None
@@ -54,6 +214,8 @@ class RedisStreamManager:
         """
         Adds a message to the stream and optionally sets a TTL for the stream.
 
+        The XADD and the optional EXPIRE are sent together in one round trip.
+
         Args:
             key (str): Name of the stream in Redis.
             data (Dict[str, str]): Message data to add to the stream.
@@ -63,15 +225,18 @@ class RedisStreamManager:
             Optional[str]: The ID of the added message, or None if an error occurred.
         """
         try:
-            message_id = self.redis_client.xadd(key, data)
-            self.log(f"Added to stream '{key}' with ID {message_id}")
+            with self.redis_client.pipeline(transaction=False) as p:
+                p.xadd(key, data)
+                if ttl:
+                    p.expire(key, ttl)
+                message_id = p.execute()[0]
+            self.log("Added to stream '{}' with ID {}", key, message_id)
 
             if ttl:
-                self.redis_client.expire(key, ttl)
-                self.log(f"Set TTL of {ttl} seconds for stream '{key}'")
+                self.log("Set TTL of {} seconds for stream '{}'", ttl, key)
 
             return message_id
-        except Exception as e:
+        except redis.RedisError as e:
             logger.error(f"Error adding to stream '{key}': {e}")
             return None
 
@@ -92,14 +257,17 @@ class RedisStreamManager:
 
         def decorator(func: Callable) -> Callable:
             if stream_name not in self.consumers:
-                self.consumers[stream_name] = {
-                    "group_name": group_name,
-                    "consumer_name": consumer_name,
-                    "callback": func,
-                }
+                # The group must exist before a listener can include the stream
+                self._create_group(stream_name, group_name)
+                self.consumers[stream_name] = ConsumerSpec(
+                    group_name, consumer_name, func
+                )
                 self._start_listener(stream_name)
                 self.log(
-                    f"Registered consumer for stream '{stream_name}' with group '{group_name}' and consumer '{consumer_name}'"
+                    "Registered consumer for stream '{}' with group '{}' and consumer '{}'",
+                    stream_name,
+                    group_name,
+                    consumer_name,
                 )
             else:
                 logger.warning(
@@ -109,71 +277,433 @@ class RedisStreamManager:
 
         return decorator
 
-    def _decode_message(self, data: Dict[bytes, bytes]) -> Dict[str, str]:
+    def _create_group(self, stream_name: str, group_name: str) -> None:
         """
-        Decodes the keys and values of a received message.
+        Creates a consumer group on a stream, and the stream itself, if missing.
 
-        Args:
-            data (Dict[bytes, bytes]): Raw message data from Redis.
+        Errors other than the group already existing, such as a key of another
+        type or a missing permission, are raised.
 
-        Returns:
-            Dict[str, str]: Decoded message data.
+        Args:
+            stream_name (str): Name of the Redis stream.
+            group_name (str): Name of the consumer group.
         """
-        return {
-            key.decode(): value.decode() if isinstance(value, bytes) else value
-            for key, value in data.items()
-        }
+        try:
+            existing = {
+                group["name"] for group in self.redis_client.xinfo_groups(stream_name)
+            }
+        except redis.exceptions.ResponseError:
+            # The stream does not exist yet; a key of another type makes
+            # XGROUP CREATE below fail with WRONGTYPE.
+            existing = set()
+        if group_name in existing:
+            self.log(
+                "Group '{}' already exists for stream '{}'", group_name, stream_name
+            )
+            return
+
+        try:
+            self.redis_client.xgroup_create(
+                stream_name, group_name, id="0", mkstream=True
+            )
+        except redis.exceptions.ResponseError as e:
+            # Another process created the group between both calls
+            if "BUSYGROUP" not in str(e):
+                raise
 
     def _start_listener(self, stream_name: str) -> None:
         """
-        Starts a thread to listen for messages on a specific stream.
+        Makes sure a listener thread reads a newly registered stream.
+
+        Streams registered with the same group and consumer share one listener
+        thread, which reads all of them with a single XREADGROUP call. While idle
+        the read blocks without timeout; registering another stream or stopping
+        interrupts it. Callbacks run on a thread pool, so a slow callback does not
+        hold up reading; a message is acknowledged only once its callback has
+        returned without raising.
 
         Args:
             stream_name (str): Name of the Redis stream.
         """
+        spec = self.consumers[stream_name]
+        group_name, consumer_name = spec.group_name, spec.consumer_name
+
+        listener_key = (group_name, consumer_name)
+        if self._stop.is_set():
+            # Stopped by running = False or stop_listeners; the old listeners are
+            # joined before new ones start
+            self.stop_listeners()
+            self._stop.clear()
+        if listener_key in self._listeners:
+            # Interrupt its blocking read so the new stream is included right away
+            self._wake_until_registered(listener_key)
+            return
+        if self.use_asyncio:
+            self._start_listener_async(listener_key)
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
 
         def listener() -> None:
-            consumer_info = self.consumers[stream_name]
-            group_name = consumer_info["group_name"]
-            consumer_name = consumer_info["consumer_name"]
-            callback = consumer_info["callback"]
-
-            # Create the consumer group if it does not exist
-            try:
-                self.redis_client.xgroup_create(
-                    stream_name, group_name, id="0", mkstream=True
-                )
-            except redis.exceptions.ResponseError:
-                self.log(
-                    f"Group '{group_name}' already exists for stream '{stream_name}'",
-                    level="warning",
-                )
-
-            self.log(f"Listening for messages on stream '{stream_name}'...")
-            self.running = True
-            while self.running:
+            # Messages whose callback succeeded, acked before the next read and
+            # by stop_listeners for callbacks that finish after the last one
+            completed = self._completed[listener_key] = deque()
+            # Bounds the callbacks queued on the executor so a slow consumer does
+            # not read the whole stream into memory
+            slots = threading.Semaphore(2 * self.max_workers)
+
+            # Callbacks not finished yet; while any are, reads block for at most
+            # a second so their acks are not held back by an idle stream
+            outstanding = set()
+
+            def on_done(future: Future, stream: str, message_id: str) -> None:
+                # Queued for ack before leaving outstanding, so the reader cannot
+                # find both empty and block without timeout while an ack is pending
+                if future.exception() is None:
+                    completed.append((stream, message_id))
+                else:
+                    logger.error(
+                        f"Error processing message {message_id} from stream "
+                        f"'{stream}': {future.exception()}"
+                    )
+                outstanding.discard(future)
+                slots.release()
+
+            # Reads hold a connection of their own, outside the shared pool so
+            # listeners never starve other managers; its client ID lets
+            # _wake_listener interrupt a read blocked without timeout.
+            reader_pool = create_pool(
+                self.host,
+                self.port,
+                self.db,
+                decode_responses=True,
+                max_connections=1,
+                unix_socket_path=self.unix_socket_path,
+            )
+            reader = redis.StrictRedis(
+                connection_pool=reader_pool, single_connection_client=True
+            )
+            reader_id = _ReaderIdTracker(self._reader_ids, listener_key)
+            reader.connection.register_connect_callback(reader_id.on_connect)
+
+            # Bound once so the per-message loop only touches local variables.
+            xreadgroup = reader.xreadgroup
+            ack_completed = self._ack_completed
+            submit = self._executor.submit
+            acquire = slots.acquire
+            track = outstanding.add
+            log = self.log
+            consumers = self.consumers
+            batch_size = self.batch_size
+            stop = self._stop
+
+            # Rebuilt only when a stream is registered (consumers only grow).
+            registered = -1
+            streams = {}
+            callbacks = {}
+
+            backoff = 0.0
+            while not stop.is_set():
+                if len(consumers) != registered:
+                    registered = len(consumers)
+                    callbacks = {
+                        name: spec.callback
+                        for name, spec in tuple(consumers.items())
+                        if spec.group_name == group_name
+                        and spec.consumer_name == consumer_name
+                    }
+                    streams = dict.fromkeys(callbacks, ">")
+                    self._registered_counts[listener_key] = registered
                 try:
-                    messages = self.redis_client.xreadgroup(
+                    if self._reader_ids.get(listener_key) is None:
+                        self._reader_ids[listener_key] = reader.client_id()
+                    ack_completed(group_name, completed)
+                    messages = xreadgroup(
                         group_name,
                         consumer_name,
-                        streams={stream_name: ">"},
-                        count=1,
-                        block=1000,
+                        streams=streams,
+                        count=batch_size,
+                        block=1000 if outstanding or completed else 0,
                     )
                     for stream, entries in messages:
+                        callback = callbacks[stream]
                         for message_id, data in entries:
-                            decoded_data = self._decode_message(data)
-                            self.log(
-                                f"Message received from stream '{stream}': {decoded_data}"
+                            log("Message received from stream '{}': {}", stream, data)
+                            acquire()
+                            future = submit(callback, data)
+                            track(future)
+                            future.add_done_callback(
+                                partial(on_done, stream=stream, message_id=message_id)
                             )
-                            callback(decoded_data)
-                            self.redis_client.xack(stream_name, group_name, message_id)
-                except Exception as e:
-                    logger.error(f"Error reading from stream '{stream_name}': {e}")
+                    backoff = 0.0
+                except redis.RedisError as e:
+                    logger.error(f"Error reading from streams {list(streams)}: {e}")
+                    # The connection is down; reader_id records the ID of the
+                    # next one, or it is fetched again before the next read
+                    self._reader_ids[listener_key] = None
+                    # Back off exponentially so a lost server is not hammered
+                    backoff = min(max(2 * backoff, 0.1), 5.0)
+                    stop.wait(backoff)
+
+            self._reader_ids[listener_key] = None
+            reader.close()
+            reader_pool.disconnect()
 
         thread = threading.Thread(target=listener)
         thread.daemon = True
+        self._listeners[listener_key] = thread
         thread.start()
+        self.log(
+            "Listening for messages of group '{}' as consumer '{}'...",
+            group_name,
+            consumer_name,
+        )
+
+    def _start_listener_async(self, listener_key: Tuple[str, str]) -> None:
+        """
+        Adds a listener coroutine for a group and consumer, starting the event loop
+        thread that runs run_forever if it is not running yet.
+
+        Args:
+            listener_key (Tuple[str, str]): Group and consumer name of the listener.
+        """
+        if self._listeners:
+            thread = next(iter(self._listeners.values()))
+            self._notify_loop()
+        else:
+            thread = threading.Thread(target=asyncio.run, args=(self.run_forever(),))
+            thread.daemon = True
+            thread.start()
+        self._listeners[listener_key] = thread
+        self.log(
+            "Listening for messages of group '{}' as consumer '{}' on the event loop...",
+            *listener_key,
+        )
+
+    def _notify_loop(self) -> None:
+        """
+        Wakes run_forever from another thread so it picks up new registrations or
+        stops.
+        """
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._registered.set)
+        except RuntimeError:
+            # The loop closed in the meantime
+            pass
+
+    async def _listen_async(
+        self,
+        pool: redis.asyncio.BlockingConnectionPool,
+        group_name: str,
+        consumer_name: str,
+    ) -> None:
+        """
+        Asyncio counterpart of the listener thread started by _start_listener.
+
+        Callbacks run on the event loop, so every batch is acknowledged once it has
+        been processed, with one XACK per stream listing the messages whose callback
+        did not raise.
+
+        Args:
+            pool (redis.asyncio.BlockingConnectionPool): Pool of the running loop,
+                used for acknowledgements.
+            group_name (str): Name of the consumer group.
+            consumer_name (str): Name of the consumer.
+        """
+        listener_key = (group_name, consumer_name)
+        # Reads hold a connection of their own, see _start_listener
+        reader_pool = create_async_pool(
+            self.host,
+            self.port,
+            self.db,
+            decode_responses=True,
+            max_connections=1,
+            unix_socket_path=self.unix_socket_path,
+        )
+        reader = redis.asyncio.StrictRedis(
+            connection_pool=reader_pool, single_connection_client=True
+        )
+        reader_id = _ReaderIdTracker(self._reader_ids, listener_key)
+        client = redis.asyncio.StrictRedis(connection_pool=pool)
+
+        # Bound once so the per-message loop only touches local variables.
+        xreadgroup = reader.xreadgroup
+        consumers = self.consumers
+        stop = self._stop
+        log = self.log
+        batch_size = self.batch_size
+
+        # Rebuilt only when a stream is registered; each callback is stored with
+        # whether it must be awaited, so that is not checked per batch.
+        registered = -1
+        streams = {}
+        callbacks = {}
+
+        backoff = 0.0
+        try:
+            while not stop.is_set():
+                if len(consumers) != registered:
+                    registered = len(consumers)
+                    callbacks = {
+                        name: (
+                            spec.callback,
+                            asyncio.iscoroutinefunction(spec.callback),
+                        )
+                        for name, spec in tuple(consumers.items())
+                        if spec.group_name == group_name
+                        and spec.consumer_name == consumer_name
+                    }
+                    streams = dict.fromkeys(callbacks, ">")
+                    self._registered_counts[listener_key] = registered
+                try:
+                    if reader.connection is None:
+                        # The connection is only taken from the pool on first use
+                        await reader.initialize()
+                        reader.connection.register_connect_callback(
+                            reader_id.on_connect_async
+                        )
+                    if self._reader_ids.get(listener_key) is None:
+                        self._reader_ids[listener_key] = await reader.client_id()
+                    messages = await xreadgroup(
+                        group_name,
+                        consumer_name,
+                        streams=streams,
+                        count=batch_size,
+                        block=0,
+                    )
+                    ack_ids: Dict[str, list] = {}
+                    for stream, entries in messages:
+                        callback, is_coroutine = callbacks[stream]
+                        for message_id, data in entries:
+                            log("Message received from stream '{}': {}", stream, data)
+                            try:
+                                if is_coroutine:
+                                    await callback(data)
+                                else:
+                                    callback(data)
+                            except Exception as e:
+                                logger.error(
+                                    f"Error processing message {message_id} from "
+                                    f"stream '{stream}': {e}"
+                                )
+                                continue
+                            ack_ids.setdefault(stream, []).append(message_id)
+                    if ack_ids:
+                        async with client.pipeline(transaction=False) as p:
+                            for stream, ids in ack_ids.items():
+                                p.xack(stream, group_name, *ids)
+                            await p.execute()
+                    backoff = 0.0
+                except redis.RedisError as e:
+                    logger.error(f"Error reading from streams {list(streams)}: {e}")
+                    self._reader_ids[listener_key] = None
+                    backoff = min(max(2 * backoff, 0.1), 5.0)
+                    await asyncio.sleep(backoff)
+        finally:
+            self._reader_ids[listener_key] = None
+            await reader.aclose()
+            await reader_pool.disconnect()
+
+    async def run_forever(self) -> None:
+        """
+        Reads every registered stream from the current event loop until
+        stop_listeners() is called.
+
+        Each group and consumer gets a listener coroutine; blocking reads are
+        awaited, so one thread serves any number of them. Run in a dedicated thread
+        on the first registration when use_asyncio is set.
+        """
+        self._registered = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        pool = create_async_pool(
+            self.host,
+            self.port,
+            self.db,
+            unix_socket_path=self.unix_socket_path,
+            decode_responses=True,
+        )
+        tasks = {}
+        try:
+            while not self._stop.is_set():
+                self._registered.clear()
+                for spec in tuple(self.consumers.values()):
+                    listener_key = (spec.group_name, spec.consumer_name)
+                    if listener_key not in tasks:
+                        tasks[listener_key] = asyncio.create_task(
+                            self._listen_async(pool, *listener_key)
+                        )
+                await self._registered.wait()
+            await asyncio.gather(*tasks.values())
+        finally:
+            self._loop = None
+            await pool.disconnect()
+
+    def _wake_until_registered(self, listener_key: Tuple[str, str]) -> None:
+        """
+        Wakes a listener until it has picked up the current registrations.
+
+        A CLIENT UNBLOCK sent before the listener's read has started blocking is
+        lost, so it is repeated until the listener reports the new registration
+        count, for at most a second. A listener that is still busy by then is not
+        blocked, and rebuilds its streams before its next read.
+
+        Args:
+            listener_key (Tuple[str, str]): Group and consumer name of the listener.
+        """
+        target = len(self.consumers)
+        thread = self._listeners[listener_key]
+        deadline = time.monotonic() + 1.0
+        while (
+            self._registered_counts.get(listener_key, -1) < target
+            and thread.is_alive()
+            and time.monotonic() < deadline
+        ):
+            self._wake_listener(listener_key)
+            thread.join(timeout=0.01)
+
+    def _wake_listener(self, listener_key: Tuple[str, str]) -> None:
+        """
+        Interrupts the blocking XREADGROUP of a listener thread with CLIENT UNBLOCK.
+
+        Args:
+            listener_key (Tuple[str, str]): Group and consumer name of the listener.
+        """
+        client_id = self._reader_ids.get(listener_key)
+        if client_id is None:
+            return
+        try:
+            self.redis_client.client_unblock(client_id)
+        except redis.RedisError as e:
+            logger.error(f"Error waking listener {listener_key}: {e}")
+
+    def _ack_completed(self, group_name: str, completed: deque) -> None:
+        """
+        Acknowledges the messages whose callbacks have finished, with one XACK per
+        stream listing all of its IDs, pipelined when several streams are involved.
+
+        Args:
+            group_name (str): Name of the consumer group.
+            completed (deque): (stream, message ID) pairs to acknowledge, drained.
+        """
+        ack_ids: Dict[str, list] = {}
+        while completed:
+            stream, message_id = completed.popleft()
+            ack_ids.setdefault(stream, []).append(message_id)
+        if not ack_ids:
+            return
+        if len(ack_ids) == 1:
+            # The common case of one busy stream needs no pipeline
+            ((stream, ids),) = ack_ids.items()
+            self.redis_client.xack(stream, group_name, *ids)
+            return
+
+        with self.redis_client.pipeline(transaction=False) as p:
+            for stream, ids in ack_ids.items():
+                p.xack(stream, group_name, *ids)
+            p.execute()
 
     def read_from_stream(
         self, key: str, count: int = 1, block: Optional[int] = None
@@ -193,28 +723,75 @@ class RedisStreamManager:
             messages = self.redis_client.xread({key: "$"}, count=count, block=block)
             decoded_messages = [
                 {
-                    "stream": stream.decode(),
+                    "stream": stream,
                     "entries": [
-                        {"id": entry_id.decode(), "data": self._decode_message(data)}
-                        for entry_id, data in entries
+                        {"id": entry_id, "data": data} for entry_id, data in entries
                     ],
                 }
                 for stream, entries in messages
             ]
-            self.log(f"Messages read from stream '{key}': {decoded_messages}")
+            self.log("Messages read from stream '{}': {}", key, decoded_messages)
             return decoded_messages
-        except Exception as e:
+        except redis.RedisError as e:
             logger.error(f"Error reading messages from stream '{key}': {e}")
             return []
 
+    def stop_listeners(self, timeout: float = 10.0) -> None:
+        """
+        Stops every listener thread, interrupting reads that are blocked, waits for
+        the callbacks already submitted and acknowledges their messages. Messages
+        whose callback raised stay pending.
+
+        Args:
+            timeout (float): Seconds to wait for the listener threads to exit. A
+                listener that could not be woken by then is left behind as a
+                daemon thread, and exits once its read returns.
+        """
+        self._stop.set()
+        threads = set(self._listeners.values())
+        deadline = time.monotonic() + timeout
+        # Repeated in case a listener was about to block when first woken
+        while any(thread.is_alive() for thread in threads):
+            if time.monotonic() >= deadline:
+                logger.warning(
+                    f"Listeners still running after {timeout}s, no longer waiting"
+                )
+                break
+            for listener_key in tuple(self._listeners):
+                self._wake_listener(listener_key)
+            self._notify_loop()
+            for thread in threads:
+                thread.join(timeout=0.1)
+        self._listeners.clear()
+        self._registered_counts.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        # Only now have all callbacks finished, so nothing is left to ack after this
+        for (group_name, _), completed in self._completed.items():
+            try:
+                self._ack_completed(group_name, completed)
+            except redis.RedisError as e:
+                logger.error(
+                    f"Error acknowledging messages of group '{group_name}': {e}"
+                )
+        self._completed.clear()
+
     def wait(self) -> None:
         """
-        Keeps the program active and handles interrupt signals to stop consumers cleanly.
+        Blocks until the listeners are stopped, stopping them cleanly on SIGINT.
+
+        Returns once stop_listeners has been called, by the signal handler or by
+        another thread. The handler is only installed when called from the main
+        thread, where Python delivers signals.
         """
 
         def signal_handler(sig: int, frame: Optional[object]) -> None:
             logger.info("Stopping consumers...")
-            self.running = False
+            self.stop_listeners()
 
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.pause()
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, signal_handler)
+        # Waits in short steps so the handler can run on every platform
+        while not self._stop.wait(timeout=1.0):
+            pass